@@ -1,4 +1,23 @@
 from .smart_list import SmartList
 from .smart_dict import SmartDict
+from .numeric_list import NumericSmartList
+from .lazy import LazySmartList
+from .view import SmartListView
+from .aggregation import GroupBy, Rolling
+from .sorted_list import SortedSmartList
+from .paths import PathAccessor, PathSet
+from .records import SmartRecord
 
-__all__ = ["SmartList", "SmartDict"]
+__all__ = [
+    "SmartList",
+    "SmartDict",
+    "NumericSmartList",
+    "LazySmartList",
+    "SmartListView",
+    "GroupBy",
+    "Rolling",
+    "SortedSmartList",
+    "PathAccessor",
+    "PathSet",
+    "SmartRecord",
+]
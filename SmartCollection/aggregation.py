@@ -0,0 +1,196 @@
+from collections import deque
+from operator import ge, itemgetter, le
+
+from .smart_dict import SmartDict
+from .smart_list import SmartList
+
+
+REDUCTIONS = ("count", "sum", "mean", "min", "max")
+
+
+def _accessor(selector):
+    """Turn a callable, or a key/index to look up on each item, into a function."""
+    if selector is None or callable(selector):
+        return selector
+    return itemgetter(selector)
+
+
+class _GroupState:
+    __slots__ = ("count", "total", "minimum", "maximum", "values")
+
+    def __init__(self, first, keep_values):
+        self.count = 0
+        self.total = 0
+        self.minimum = first
+        self.maximum = first
+        self.values = SmartList() if keep_values else None
+
+
+class GroupBy:
+    """
+    Items of a SmartList grouped by a key, ready to be aggregated in one pass.
+
+    Created by SmartList.group_by(). Groups keep the order in which their keys
+    first appear.
+
+    Examples:
+        >>> sales = SmartList([
+        ...     {"region": "north", "amount": 10},
+        ...     {"region": "south", "amount": 4},
+        ...     {"region": "north", "amount": 20},
+        ... ])
+        >>> sales.group_by("region", value="amount").agg(total="sum", average="mean")
+        {'north': {'total': 30, 'average': 15.0}, 'south': {'total': 4, 'average': 4.0}}
+    """
+
+    def __init__(self, items, key, value=None):
+        self._items = items
+        self._key = _accessor(key)
+        self._value = _accessor(value)
+
+    def agg(self, **aggregations):
+        """
+        Compute named aggregations for every group.
+
+        Each aggregation is either the name of a built-in reduction ("count",
+        "sum", "mean", "min", "max"), which is accumulated on the fly without
+        storing the group, or a callable that receives the group's values as a
+        SmartList.
+
+        Args:
+            **aggregations: Output names mapped to reductions
+
+        Returns:
+            SmartDict: Group keys mapped to SmartDicts of aggregation results
+
+        Raises:
+            ValueError: If no aggregations are given or a reduction name is unknown
+        """
+        if not aggregations:
+            raise ValueError("Provide at least one aggregation, e.g. agg(total='sum').")
+        reductions = set()
+        keep_values = False
+        for name, reduction in aggregations.items():
+            if callable(reduction):
+                keep_values = True
+            elif reduction in REDUCTIONS:
+                reductions.add(reduction)
+            else:
+                raise ValueError(
+                    f"Unsupported aggregation for '{name}': {reduction}. "
+                    f"Use one of {', '.join(REDUCTIONS)} or a callable."
+                )
+
+        track_total = bool(reductions & {"sum", "mean"})
+        track_extremes = bool(reductions & {"min", "max"})
+        key, value = self._key, self._value
+        groups = {}
+
+        for item in self._items:
+            item_value = item if value is None else value(item)
+            group_key = key(item)
+            state = groups.get(group_key)
+            if state is None:
+                groups[group_key] = state = _GroupState(item_value, keep_values)
+            state.count += 1
+            if track_total:
+                state.total += item_value
+            if track_extremes:
+                if item_value < state.minimum:
+                    state.minimum = item_value
+                elif item_value > state.maximum:
+                    state.maximum = item_value
+            if keep_values:
+                state.values.append(item_value)
+
+        result = SmartDict()
+        for group_key, state in groups.items():
+            result[group_key] = SmartDict(
+                {
+                    name: self._finish(reduction, state)
+                    for name, reduction in aggregations.items()
+                }
+            )
+        return result
+
+    @staticmethod
+    def _finish(reduction, state):
+        match reduction:
+            case "count":
+                return state.count
+            case "sum":
+                return state.total
+            case "mean":
+                return state.total / state.count
+            case "min":
+                return state.minimum
+            case "max":
+                return state.maximum
+            case _:
+                return reduction(state.values)
+
+
+class Rolling:
+    """
+    Fixed-size sliding windows over a SmartList.
+
+    Created by SmartList.rolling(). Every method makes a single pass: sums and
+    means keep a running total, and min/max keep a monotonic deque of candidate
+    positions, so each element is added and removed at most once. Only full
+    windows produce a value, so the result has len(items) - window + 1 elements.
+
+    Examples:
+        >>> prices = SmartList([3, 1, 4, 1, 5, 9])
+        >>> prices.rolling(3).sum()
+        [8, 6, 10, 15]
+        >>> prices.rolling(3).max()
+        [4, 4, 5, 9]
+    """
+
+    def __init__(self, items, window):
+        if not isinstance(window, int) or window < 1:
+            raise ValueError(f"Window must be a positive integer, got {window}")
+        self._items = items
+        self._window = window
+
+    def sum(self):
+        """Return the sum of every full window."""
+        window = self._window
+        result = SmartList()
+        total = 0
+        # A second iterator trails the first by one window, yielding the item to drop.
+        leaving = iter(self._items)
+        for index, item in enumerate(self._items):
+            total += item
+            if index >= window:
+                total -= next(leaving)
+            if index >= window - 1:
+                result.append(total)
+        return result
+
+    def mean(self):
+        """Return the arithmetic mean of every full window."""
+        window = self._window
+        return SmartList(total / window for total in self.sum())
+
+    def max(self):
+        """Return the largest element of every full window."""
+        return self._extreme(ge)
+
+    def min(self):
+        """Return the smallest element of every full window."""
+        return self._extreme(le)
+
+    def _extreme(self, dominates):
+        window = self._window
+        result = SmartList()
+        candidates = deque()
+        for index, item in enumerate(self._items):
+            while candidates and dominates(item, candidates[-1][1]):
+                candidates.pop()
+            candidates.append((index, item))
+            if candidates[0][0] <= index - window:
+                candidates.popleft()
+            if index >= window - 1:
+                result.append(candidates[0][1])
+        return result
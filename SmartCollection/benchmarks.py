@@ -0,0 +1,238 @@
+"""
+Benchmarks for SmartList and SmartDict against plain list and dict baselines.
+
+Run from the directory containing the SmartCollection package:
+
+    python -m SmartCollection.benchmarks --save baseline.json
+    python -m SmartCollection.benchmarks --compare baseline.json
+
+Each case is timed with timeit at every size (1e2 to 1e7 elements by default)
+for both the SmartCollection operation and an equivalent written with plain
+lists and dicts. Results can be saved as JSON, and a later run compared against
+them: any case whose SmartCollection time grew by more than --threshold is
+reported as a regression and the script exits with status 1.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+
+from .smart_dict import SmartDict
+from .smart_list import SmartList
+
+
+SIZES = [10**exponent for exponent in range(2, 8)]
+
+
+def _numbers(size):
+    rng = random.Random(size)
+    return [rng.randrange(size) for _ in range(size)]
+
+
+def _document(size, width=100):
+    """A two-level document with about size integer leaves."""
+    groups = max(size // width, 1)
+    return {
+        f"group{group}": {f"key{key}": group * width + key for key in range(min(width, size))}
+        for group in range(groups)
+    }
+
+
+def _transform_plain(value, function):
+    if isinstance(value, dict):
+        return {key: _transform_plain(item, function) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_transform_plain(item, function) for item in value]
+    return function(value)
+
+
+def _merge_plain(base, other):
+    result = dict(base)
+    for key, value in other.items():
+        if isinstance(result.get(key), dict) and isinstance(value, dict):
+            result[key] = _merge_plain(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def _increment(value):
+    return value + 1
+
+
+# Each case takes a size and returns (SmartCollection callable, baseline callable).
+
+
+def case_add(size):
+    a, b = _numbers(size), _numbers(size)
+    smart_a, smart_b = SmartList(a), SmartList(b)
+    return (lambda: smart_a + smart_b), (lambda: [x + y for x, y in zip(a, b)])
+
+
+def case_mul_scalar(size):
+    data = _numbers(size)
+    smart = SmartList(data)
+    return (lambda: smart * 3), (lambda: [x * 3 for x in data])
+
+
+def case_where(size):
+    data = _numbers(size)
+    smart = SmartList(data)
+    limit = size // 2
+    return (
+        lambda: smart.where(operator=">", value=limit),
+        lambda: [x for x in data if x > limit],
+    )
+
+
+def case_median(size):
+    # A fresh SmartList per call, so the cached sorted index is not measured.
+    data = _numbers(size)
+    return (lambda: SmartList(data).median()), (lambda: statistics.median(data))
+
+
+def case_mode(size):
+    data = _numbers(size)
+    return (lambda: SmartList(data).mode()), (lambda: statistics.multimode(data))
+
+
+def case_step_slice(size):
+    data = _numbers(size)
+    smart = SmartList(data)
+    return (lambda: smart[::3]), (lambda: data[::3])
+
+
+def case_getattr_chain(size):
+    # size attribute chains of depth five.
+    nested = {"a": {"b": {"c": {"d": {"e": 1}}}}}
+    smart = SmartDict(nested)
+    lookups = range(size)
+
+    def smart_chain():
+        for _ in lookups:
+            smart.a.b.c.d.e
+
+    def plain_chain():
+        for _ in lookups:
+            nested["a"]["b"]["c"]["d"]["e"]
+
+    return smart_chain, plain_chain
+
+
+def case_transform(size):
+    document = _document(size)
+    smart = SmartDict(document)
+    return (
+        lambda: smart.transform(_increment),
+        lambda: _transform_plain(document, _increment),
+    )
+
+
+def case_merge(size):
+    # Merge in an update touching about 1% of the groups.
+    document = _document(size)
+    update = {
+        group: {"key0": -1} for index, group in enumerate(document) if index % 100 == 0
+    }
+    smart = SmartDict(document)
+    return (lambda: smart.merge(update)), (lambda: _merge_plain(document, update))
+
+
+CASES = {
+    "add": case_add,
+    "mul_scalar": case_mul_scalar,
+    "where": case_where,
+    "median": case_median,
+    "mode": case_mode,
+    "step_slice": case_step_slice,
+    "getattr_chain": case_getattr_chain,
+    "transform": case_transform,
+    "merge": case_merge,
+}
+
+
+def measure(function, repeat):
+    """Return the best time per call, in seconds, over repeat timeit runs."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(cases, sizes, repeat, stream=sys.stdout):
+    results = {}
+    for name in cases:
+        results[name] = {}
+        for size in sizes:
+            smart, baseline = CASES[name](size)
+            timing = {"smart": measure(smart, repeat), "baseline": measure(baseline, repeat)}
+            results[name][str(size)] = timing
+            print(
+                f"{name:<14} {size:>10,}  smart {timing['smart']:.3e}s  "
+                f"baseline {timing['baseline']:.3e}s  "
+                f"ratio {timing['smart'] / timing['baseline']:6.2f}",
+                file=stream,
+                flush=True,
+            )
+    return results
+
+
+def find_regressions(previous, current, threshold):
+    """Return (case, size, old, new) for every SmartCollection time that grew by more than threshold."""
+    regressions = []
+    for name, by_size in current.items():
+        for size, timing in by_size.items():
+            old = previous.get(name, {}).get(size)
+            if old and timing["smart"] > old["smart"] * (1 + threshold):
+                regressions.append((name, size, old["smart"], timing["smart"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--sizes", nargs="+", type=lambda text: int(float(text)), default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", metavar="PATH", help="write the results to a JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="JSON file from an earlier --save")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative slowdown reported as a regression (default: 0.10)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, args.sizes, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "results": results,
+                },
+                fp,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as fp:
+            previous = json.load(fp)["results"]
+        regressions = find_regressions(previous, results, args.threshold)
+        for name, size, old, new in regressions:
+            print(f"REGRESSION {name} at {size}: {old:.3e}s -> {new:.3e}s ({new / old - 1:+.0%})")
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+from .smart_list import SmartList, is_scalar
+from .numeric_list import NumericSmartList, np
+from .predicates import conditions_mask, parse_where
+
+UFUNC_NAMES = {
+    "+": "add",
+    "-": "subtract",
+    "*": "multiply",
+    "/": "true_divide",
+    "//": "floor_divide",
+}
+
+
+class _Source:
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+class _Constant:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _BinOp:
+    __slots__ = ("symbol", "left", "right")
+
+    def __init__(self, symbol, left, right):
+        self.symbol = symbol
+        self.left = left
+        self.right = right
+
+
+class LazySmartList:
+    """
+    A deferred SmartList expression.
+
+    Arithmetic operators and where() filters build an expression tree instead of
+    allocating an intermediate SmartList at every step. The whole tree is fused
+    into a single pass over the source lists and only evaluated on iteration,
+    len(), or an explicit collect(). The result is cached, so it is computed once.
+
+    Lists created with SmartList.from_numeric() are evaluated with NumPy ufuncs,
+    reusing intermediate buffers where the dtypes allow it.
+
+    Scalars are broadcast like in SmartList, and list operands must have the
+    same length; a mismatch raises ValueError when the expression is collected.
+
+    Arithmetic on an expression that already has a where() filter first
+    materializes the filtered values, because filtering changes the positions
+    that the other operand would be aligned with.
+
+    Examples:
+        >>> a, b, c = SmartList([1, 2, 3]), SmartList([4, 5, 6]), SmartList([2, 2, 2])
+        >>> expr = ((a.lazy() + b) * c).where(operator=">", value=10)
+        >>> expr.collect()
+        [14, 18]
+    """
+
+    def __init__(self, node, filters=()):
+        if not isinstance(node, (_Source, _Constant, _BinOp)):
+            node = _Source(node)
+        self._node = node
+        self._filters = tuple(filters)
+        self._result = None
+
+    def _as_node(self):
+        if self._filters:
+            return _Source(self.collect())
+        return self._node
+
+    def _combine(self, symbol, other, reflected=False):
+        if isinstance(other, LazySmartList):
+            other = other._as_node()
+        elif is_scalar(other):
+            other = _Constant(other)
+        else:
+            other = _Source(other)
+        if reflected:
+            return type(self)(_BinOp(symbol, other, self._as_node()))
+        return type(self)(_BinOp(symbol, self._as_node(), other))
+
+    def __add__(self, other):
+        return self._combine("+", other)
+
+    def __sub__(self, other):
+        return self._combine("-", other)
+
+    def __mul__(self, other):
+        return self._combine("*", other)
+
+    def __truediv__(self, other):
+        return self._combine("/", other)
+
+    def __floordiv__(self, other):
+        return self._combine("//", other)
+
+    def __radd__(self, other):
+        return self._combine("+", other, reflected=True)
+
+    def __rsub__(self, other):
+        return self._combine("-", other, reflected=True)
+
+    def __rmul__(self, other):
+        return self._combine("*", other, reflected=True)
+
+    def __rtruediv__(self, other):
+        return self._combine("/", other, reflected=True)
+
+    def __rfloordiv__(self, other):
+        return self._combine("//", other, reflected=True)
+
+    def where(
+        self, predicate=None, operator=None, value=None, conditions=None, combine="and"
+    ):
+        """
+        Add a filter to the expression without evaluating it.
+
+        Accepts the same arguments as SmartList.where().
+
+        Returns:
+            LazySmartList: A new expression with the filter appended
+
+        Raises:
+            ValueError: If invalid arguments are provided
+        """
+        condition = parse_where(predicate, operator, value, conditions, combine)
+        return type(self)(self._node, self._filters + (condition,))
+
+    def collect(self):
+        """
+        Evaluate the expression in a single pass.
+
+        Returns:
+            SmartList or NumericSmartList: The materialized result. A
+            NumericSmartList is returned when every source is array-backed.
+        """
+        if self._result is None:
+            sources = []
+            _collect_sources(self._node, sources)
+            _check_lengths(sources)
+            if np is not None and all(
+                isinstance(source.data, NumericSmartList) for source in sources
+            ):
+                self._result = self._evaluate_arrays()
+            else:
+                self._result = self._evaluate_fused(sources)
+        return self._result
+
+    def __iter__(self):
+        return iter(self.collect())
+
+    def __len__(self):
+        return len(self.collect())
+
+    def __repr__(self):
+        return repr(self.collect())
+
+    def _evaluate_fused(self, sources):
+        """
+        Generate one list comprehension for the whole tree and run it.
+
+        Only validated operator symbols and generated names are placed in the
+        code; source lists, filter values and predicates are passed in the namespace.
+        """
+        namespace = {}
+        row_names = {}
+        for source in sources:
+            if id(source.data) not in row_names:
+                index = len(row_names)
+                row_names[id(source.data)] = f"_a{index}"
+                namespace[f"_s{index}"] = source.data
+        source_names = list(namespace)
+
+        expression = _emit(self._node, row_names, namespace)
+
+        conditions = []
+        for index, (predicate, comparisons, combine) in enumerate(self._filters):
+            if predicate is not None:
+                namespace[f"_c{index}"] = predicate
+                conditions.append(f"_c{index}(_v)")
+                continue
+            terms = []
+            for position, (operator, value) in enumerate(comparisons):
+                name = f"_c{index}_{position}"
+                if operator == "between":
+                    namespace[f"{name}_low"], namespace[f"{name}_high"] = value
+                    terms.append(f"{name}_low <= _v <= {name}_high")
+                else:
+                    namespace[name] = value
+                    terms.append(f"_v {operator} {name}")
+            conditions.append(f"({f' {combine} '.join(terms)})")
+
+        targets = ", ".join(row_names.values())
+        if len(source_names) == 1:
+            iterable = source_names[0]
+        else:
+            iterable = f"zip({', '.join(source_names)}, strict=True)"
+        if conditions:
+            code = (
+                f"[_v for {targets} in {iterable} for _v in ({expression},) "
+                f"if {' and '.join(conditions)}]"
+            )
+        else:
+            code = f"[{expression} for {targets} in {iterable}]"
+        namespace["__builtins__"] = {"zip": zip}
+        return SmartList(eval(code, namespace))
+
+    def _evaluate_arrays(self):
+        result, owned = _evaluate_array(self._node)
+        if self._filters:
+            mask = np.ones(len(result), dtype=bool)
+            for predicate, comparisons, combine in self._filters:
+                if predicate is None:
+                    mask &= conditions_mask(result, comparisons, combine)
+                else:
+                    mask &= np.fromiter(
+                        map(predicate, result.tolist()), dtype=bool, count=len(result)
+                    )
+            return NumericSmartList(result[mask])
+        return NumericSmartList(result if owned else result.copy())
+
+
+def _collect_sources(node, sources):
+    if isinstance(node, _Source):
+        sources.append(node)
+    elif isinstance(node, _BinOp):
+        _collect_sources(node.left, sources)
+        _collect_sources(node.right, sources)
+
+
+def _check_lengths(sources):
+    lengths = {len(source.data) for source in sources if hasattr(source.data, "__len__")}
+    if len(lengths) > 1:
+        raise ValueError(f"Length mismatch between operands: {sorted(lengths)}")
+
+
+def _emit(node, row_names, namespace):
+    if isinstance(node, _Source):
+        return row_names[id(node.data)]
+    if isinstance(node, _Constant):
+        name = f"_k{len(namespace)}"
+        namespace[name] = node.value
+        return name
+    left = _emit(node.left, row_names, namespace)
+    right = _emit(node.right, row_names, namespace)
+    return f"({left} {node.symbol} {right})"
+
+
+def _evaluate_array(node):
+    """
+    Evaluate a node with NumPy, returning (array, owned).
+
+    Owned arrays are temporaries created during evaluation and are reused as
+    the output buffer of the next ufunc when its result dtype fits.
+    """
+    if isinstance(node, _Source):
+        return node.data.to_numpy(), False
+    if isinstance(node, _Constant):
+        return node.value, False
+
+    left, left_owned = _evaluate_array(node.left)
+    right, right_owned = _evaluate_array(node.right)
+    ufunc = getattr(np, UFUNC_NAMES[node.symbol])
+
+    for buffer, owned in ((left, left_owned), (right, right_owned)):
+        if owned:
+            try:
+                return ufunc(left, right, out=buffer), True
+            except TypeError:
+                pass
+    return ufunc(left, right), True
+
@@ -0,0 +1,390 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; SmartList.from_numeric falls back to lists
+    np = None
+
+from .parallel import (
+    SharedArray,
+    array_count_chunk,
+    array_filter_chunk,
+    array_sum_chunk,
+    chunk_slices,
+    map_chunks,
+    use_parallel,
+)
+from .predicates import conditions_mask, parse_where
+from .smart_list import SmartList, is_scalar
+
+
+NUMERIC_KINDS = "iuf"
+
+
+class NumericSmartList:
+    """
+    A SmartList counterpart that stores numeric data in a contiguous NumPy array.
+
+    Element-wise operators and the statistical methods run as vectorized kernels
+    instead of Python-level loops. Instances are normally created through
+    SmartList.from_numeric(), which falls back to a regular SmartList when NumPy
+    is not installed or the data is not numeric.
+
+    Division follows NumPy semantics: dividing by zero produces inf/nan and a
+    RuntimeWarning instead of raising ZeroDivisionError.
+
+    Examples:
+        >>> nums = SmartList.from_numeric([1, 2, 3, 4, 5], dtype="int64")
+        >>> nums.mean()
+        3.0
+        >>> nums + SmartList([10, 20, 30, 40, 50])
+        [11, 22, 33, 44, 55]
+    """
+
+    def __init__(self, data):
+        self._data = data
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    def to_numpy(self):
+        """
+        Return the underlying array without copying it.
+
+        Returns:
+            numpy.ndarray: The array backing this list
+        """
+        return self._data
+
+    def tolist(self):
+        """
+        Convert the data back into a regular SmartList of Python scalars.
+
+        Returns:
+            SmartList: A new SmartList with the same elements
+        """
+        return SmartList(self._data.tolist())
+
+    def lazy(self):
+        """
+        Start a deferred expression over this list.
+
+        Returns:
+            LazySmartList: An expression evaluated with NumPy ufuncs on collect()
+        """
+        from .lazy import LazySmartList
+
+        return LazySmartList(self)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(self._data.tolist())
+
+    def __repr__(self):
+        return repr(self._data.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, NumericSmartList):
+            other = other._data
+        elif is_scalar(other):
+            return NotImplemented
+        return self._data.tolist() == list(other)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return type(self)(self._data[key].copy())
+        return self._data[key].item()
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def view(self, key):
+        """
+        Return a NumericSmartList sharing storage with a slice of this one.
+
+        Args:
+            key: A slice object
+
+        Returns:
+            NumericSmartList: A list backed by a NumPy view of the same buffer
+        """
+        return type(self)(self._data[key])
+
+    def _operand(self, other, strict=True):
+        """
+        Convert the right-hand side of an operator into an array.
+
+        Scalars are left as they are so NumPy broadcasts them. Sequences must
+        match this list's length unless strict is False, in which case both
+        sides are truncated to the shorter length.
+
+        Raises:
+            ValueError: If strict is True and the lengths differ
+        """
+        if is_scalar(other):
+            return self._data, other
+        if isinstance(other, NumericSmartList):
+            other = other._data
+        else:
+            other = np.asarray(other)
+        if len(other) == len(self._data):
+            return self._data, other
+        if strict:
+            raise ValueError(
+                f"Length mismatch: {len(self._data)} != {len(other)}. Pass strict=False to truncate."
+            )
+        length = min(len(self._data), len(other))
+        return self._data[:length], other[:length]
+
+    def _apply(self, ufunc, other, strict=True, reflected=False):
+        left, right = self._operand(other, strict)
+        if reflected:
+            left, right = right, left
+        return type(self)(ufunc(left, right))
+
+    def _update(self, ufunc, other):
+        """
+        Apply a ufunc in place, writing into the existing buffer.
+
+        If the result does not fit the buffer's dtype, such as true division of
+        integers, the list switches to a new buffer of the wider dtype. Views
+        taken earlier then keep the old values.
+        """
+        left, right = self._operand(other)
+        try:
+            ufunc(left, right, out=self._data)
+        except TypeError:
+            self._data = ufunc(left, right)
+        return self
+
+    def add(self, other, strict=True):
+        return self._apply(np.add, other, strict)
+
+    def sub(self, other, strict=True):
+        return self._apply(np.subtract, other, strict)
+
+    def mul(self, other, strict=True):
+        return self._apply(np.multiply, other, strict)
+
+    def truediv(self, other, strict=True):
+        return self._apply(np.true_divide, other, strict)
+
+    def floordiv(self, other, strict=True):
+        return self._apply(np.floor_divide, other, strict)
+
+    def __add__(self, other):
+        return self._apply(np.add, other)
+
+    def __sub__(self, other):
+        return self._apply(np.subtract, other)
+
+    def __mul__(self, other):
+        return self._apply(np.multiply, other)
+
+    def __truediv__(self, other):
+        return self._apply(np.true_divide, other)
+
+    def __floordiv__(self, other):
+        return self._apply(np.floor_divide, other)
+
+    def __radd__(self, other):
+        return self._apply(np.add, other, reflected=True)
+
+    def __rsub__(self, other):
+        return self._apply(np.subtract, other, reflected=True)
+
+    def __rmul__(self, other):
+        return self._apply(np.multiply, other, reflected=True)
+
+    def __rtruediv__(self, other):
+        return self._apply(np.true_divide, other, reflected=True)
+
+    def __rfloordiv__(self, other):
+        return self._apply(np.floor_divide, other, reflected=True)
+
+    def __iadd__(self, other):
+        return self._update(np.add, other)
+
+    def __isub__(self, other):
+        return self._update(np.subtract, other)
+
+    def __imul__(self, other):
+        return self._update(np.multiply, other)
+
+    def __itruediv__(self, other):
+        return self._update(np.true_divide, other)
+
+    def __ifloordiv__(self, other):
+        return self._update(np.floor_divide, other)
+
+    def _map_shared(self, function, workers, *args):
+        """Copy the buffer into shared memory once and run function over its chunks."""
+        with SharedArray(self._data) as shared:
+            tasks = [
+                (shared.spec, part, *args)
+                for part in chunk_slices(len(self._data), workers)
+            ]
+            return map_chunks(function, tasks, workers)
+
+    def mean(self, workers=None):
+        """
+        Calculate the arithmetic mean of the elements.
+
+        Args:
+            workers: Number of processes to split the sum across. Worker processes
+                read their chunk from shared memory instead of a pickled copy.
+
+        Raises:
+            ValueError: If the list is empty
+        """
+        if not len(self._data):
+            raise ValueError("Cannot calculate mean of empty list")
+        if use_parallel(len(self._data), workers):
+            partials = self._map_shared(array_sum_chunk, workers)
+            return sum(total for total, _ in partials) / len(self._data)
+        return float(self._data.mean())
+
+    def median(self):
+        """
+        Calculate the median value of the elements.
+
+        For an odd number of elements the middle element is returned unchanged,
+        otherwise the average of the two middle values.
+        """
+        length = len(self._data)
+        if not length:
+            raise ValueError("Cannot calculate median of empty list")
+        if length % 2 == 1:
+            return np.partition(self._data, length // 2)[length // 2].item()
+        return float(np.median(self._data))
+
+    def quantile(self, q, approximate=False):
+        """
+        Calculate the q-th quantile with linear interpolation.
+
+        The approximate flag is accepted for compatibility with SmartList; the
+        exact answer is always computed since a vectorized partition is cheap.
+
+        Raises:
+            ValueError: If the list is empty or q is outside [0, 1]
+        """
+        return self.quantiles([q], approximate)[0]
+
+    def quantiles(self, qs, approximate=False):
+        """
+        Calculate several quantiles with a single partition of the array.
+
+        Raises:
+            ValueError: If the list is empty or any q is outside [0, 1]
+        """
+        qs = list(qs)
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if not len(self._data):
+            raise ValueError("Cannot calculate quantile of empty list")
+        return np.quantile(self._data, qs).tolist()
+
+    def mode(self, workers=None):
+        """
+        Return the most common element(s), in ascending order.
+
+        Args:
+            workers: Number of processes to count the elements with
+
+        Raises:
+            ValueError: If the list is empty
+        """
+        if not len(self._data):
+            raise ValueError("Cannot calculate mode of empty list")
+
+        if use_parallel(len(self._data), workers):
+            partials = self._map_shared(array_count_chunk, workers)
+            values, inverse = np.unique(
+                np.concatenate([values for values, _ in partials]), return_inverse=True
+            )
+            counts = np.bincount(
+                inverse, weights=np.concatenate([counts for _, counts in partials])
+            )
+        else:
+            values, counts = np.unique(self._data, return_counts=True)
+        return values[counts == counts.max()].tolist()
+
+    def where(
+        self,
+        predicate=None,
+        operator=None,
+        value=None,
+        conditions=None,
+        combine="and",
+        workers=None,
+    ):
+        """
+        Filter elements based on a predicate function or comparison.
+
+        Accepts the same arguments as SmartList.where(). Operator conditions are
+        evaluated as vectorized boolean masks; predicate functions are called once
+        per element. With workers, chunks are filtered in worker processes that
+        read them from shared memory; the predicate must then be picklable.
+
+        Raises:
+            ValueError: If invalid arguments are provided
+        """
+        predicate, conditions, combine = parse_where(
+            predicate, operator, value, conditions, combine
+        )
+        if use_parallel(len(self._data), workers):
+            parts = self._map_shared(
+                array_filter_chunk, workers, predicate, conditions, combine
+            )
+            return type(self)(np.concatenate(parts))
+        if predicate is None:
+            mask = conditions_mask(self._data, conditions, combine)
+        else:
+            mask = np.fromiter(
+                map(predicate, self._data.tolist()),
+                dtype=bool,
+                count=len(self._data),
+            )
+        return type(self)(self._data[mask])
+
+
+def to_numeric_array(values, dtype):
+    """
+    Convert values into a NumPy array, or return None if they are not numeric.
+
+    Args:
+        values: An iterable of values
+        dtype: The NumPy dtype to store the values as
+
+    Returns:
+        numpy.ndarray or None: The converted array, or None when NumPy is missing
+        or the values are not all integers or floats
+
+    Raises:
+        ValueError: If converting to dtype would change any value, e.g. by
+            truncating floats, wrapping integers that do not fit, or rounding
+            integers above 2**53 to float64
+    """
+    if np is None:
+        return None
+    try:
+        array = np.asarray(values)
+    except (TypeError, ValueError):
+        return None
+    if array.ndim != 1 or array.dtype.kind not in NUMERIC_KINDS:
+        return None
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f" and array.dtype.kind == "f":
+        # Narrowing between float types only rounds, which the caller asked for.
+        return array.astype(dtype, copy=False)
+    # Every other cast must survive a round trip. NumPy calls int64 -> float64
+    # "safe", but integers above 2**53 do not fit, and comparing the converted
+    # array with the original would promote both to float and hide that.
+    with np.errstate(all="ignore"):
+        converted = array.astype(dtype, copy=False)
+        restored = converted.astype(array.dtype, copy=False)
+    if not np.array_equal(restored, array):
+        raise ValueError(f"Values cannot be stored as {dtype} without changing them")
+    return converted
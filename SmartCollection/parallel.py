@@ -0,0 +1,137 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the array-backed reductions need it
+    np = None
+
+from .predicates import compile_conditions, conditions_mask
+
+
+# Lists shorter than this are always reduced in the calling process. Starting a
+# process pool and shipping the chunks to it costs tens of milliseconds, which a
+# single core recovers only once the list has around a million elements.
+PARALLEL_THRESHOLD = 1_000_000
+
+# Documents with fewer leaves than this are transformed in the calling thread.
+# Below it, submitting batches to an executor costs more than it saves unless
+# the transform function is very slow.
+TRANSFORM_THRESHOLD = 1_000
+
+
+def use_parallel(length, workers):
+    """Return True if a reduction over length elements should use a process pool."""
+    return workers is not None and workers > 1 and length >= PARALLEL_THRESHOLD
+
+
+def chunk_slices(length, workers):
+    """Split range(length) into at most workers contiguous slices of similar size."""
+    size = -(-length // workers)
+    return [slice(start, min(start + size, length)) for start in range(0, length, size)]
+
+
+def map_chunks(function, tasks, workers):
+    """Run function over tasks in a process pool, returning results in order."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, tasks))
+
+
+def sum_chunk(chunk):
+    return sum(chunk), len(chunk)
+
+
+def count_chunk(chunk):
+    return Counter(chunk)
+
+
+def filter_chunk(task):
+    predicate, conditions, combine, chunk = task
+    if predicate is None:
+        predicate = compile_conditions(conditions, combine)
+    return list(filter(predicate, chunk))
+
+
+def transform_batch(task):
+    function, batch = task
+    return list(map(function, batch))
+
+
+def map_batched(function, values, executor, batch_size=None):
+    """
+    Apply function to values on executor, in batches, returning results in order.
+
+    By default the values are split into about four batches per CPU, so each
+    task amortizes its scheduling (and, for process pools, pickling) cost over
+    many values while leaving room to balance uneven batches.
+    """
+    if executor is None or len(values) < TRANSFORM_THRESHOLD:
+        return list(map(function, values))
+    if batch_size is None:
+        batch_size = -(-len(values) // (4 * (os.cpu_count() or 1)))
+    tasks = [
+        (function, values[start : start + batch_size])
+        for start in range(0, len(values), batch_size)
+    ]
+    results = []
+    for batch in executor.map(transform_batch, tasks):
+        results.extend(batch)
+    return results
+
+
+class SharedArray:
+    """
+    A copy of a NumPy array in shared memory.
+
+    Worker processes attach to the buffer by name instead of receiving a pickled
+    copy of their chunk. Use it as a context manager so the block is released.
+    """
+
+    def __init__(self, array):
+        self._memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.spec = (self._memory.name, array.dtype.str, len(array))
+        np.ndarray(len(array), dtype=array.dtype, buffer=self._memory.buf)[:] = array
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._memory.close()
+        self._memory.unlink()
+
+
+def _run_on_shared(spec, chunk, function):
+    name, dtype, length = spec
+    memory = SharedMemory(name=name)
+    try:
+        data = np.ndarray(length, dtype=dtype, buffer=memory.buf)[chunk]
+        result = function(data)
+        del data
+        return result
+    finally:
+        memory.close()
+
+
+def array_sum_chunk(task):
+    spec, chunk = task
+    return _run_on_shared(spec, chunk, lambda data: (data.sum().item(), len(data)))
+
+
+def array_count_chunk(task):
+    spec, chunk = task
+    return _run_on_shared(spec, chunk, lambda data: np.unique(data, return_counts=True))
+
+
+def array_filter_chunk(task):
+    spec, chunk, predicate, conditions, combine = task
+
+    def select(data):
+        if predicate is None:
+            mask = conditions_mask(data, conditions, combine)
+        else:
+            mask = np.fromiter(map(predicate, data.tolist()), dtype=bool, count=len(data))
+        return data[mask].copy()
+
+    return _run_on_shared(spec, chunk, select)
@@ -0,0 +1,137 @@
+OPERATIONS = ("add", "remove", "replace")
+
+
+def _child(path, key):
+    """Extend a JSON pointer with a dict key."""
+    if not isinstance(key, str):
+        # A pointer segment is always read back as a string, so apply() could
+        # not find this key again.
+        raise TypeError(
+            f"Cannot diff dict key {key!r} at {path or '/'!r}: "
+            "JSON pointers only address string keys. Convert the keys to strings first."
+        )
+    return path + "/" + key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(segment):
+    return segment.replace("~1", "/").replace("~0", "~")
+
+
+def diff(source, target, path=""):
+    """
+    Compute the operations that turn source into target.
+
+    Nested dicts are compared key by key and lists position by position; a
+    list whose edits would outnumber its items is replaced as a whole. A
+    value that is the same object in both documents is skipped without being
+    looked at, so documents that share their unchanged subtrees (such as the
+    result of SmartDict.merge() or transform()) are compared in time
+    proportional to what changed.
+
+    Args:
+        source: The original value
+        target: The value to reach
+        path: JSON pointer prefixed to every generated path
+
+    Returns:
+        list: Operations in the JSON Patch format (RFC 6902), each a dict with
+        "op", "path" and, for add and replace, "value"
+
+    Raises:
+        TypeError: If a dict in source or target has a key that is not a string
+    """
+    operations = []
+    stack = [(path, source, target)]
+    while stack:
+        path, old, new = stack.pop()
+        if old is new:
+            continue
+        if isinstance(old, dict) and isinstance(new, dict):
+            for key, value in old.items():
+                if key not in new:
+                    operations.append({"op": "remove", "path": _child(path, key)})
+                else:
+                    stack.append((_child(path, key), value, new[key]))
+            for key, value in new.items():
+                if key not in old:
+                    operations.append(
+                        {"op": "add", "path": _child(path, key), "value": value}
+                    )
+        elif isinstance(old, list) and isinstance(new, list):
+            changes = _list_diff(old, new)
+            if len(changes) > len(new):
+                # Rewriting the list wholesale is shorter than editing it.
+                operations.append({"op": "replace", "path": path, "value": new})
+            else:
+                for change in changes:
+                    change["path"] = path + change["path"]
+                operations.extend(changes)
+        elif type(old) is not type(new) or old != new:
+            operations.append({"op": "replace", "path": path, "value": new})
+    return operations
+
+
+def _list_diff(old, new):
+    """Diff two lists position by position, with paths relative to the lists."""
+    common = min(len(old), len(new))
+    operations = []
+    for index in range(common):
+        operations.extend(diff(old[index], new[index], f"/{index}"))
+    # Trailing items are removed from the end so earlier indices stay valid.
+    for index in range(len(old) - 1, common - 1, -1):
+        operations.append({"op": "remove", "path": f"/{index}"})
+    for value in new[common:]:
+        operations.append({"op": "add", "path": "/-", "value": value})
+    return operations
+
+
+def _parent(document, path):
+    """Return (container, last segment) for a JSON pointer."""
+    if not path.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer: {path!r}")
+    *parents, last = [_unescape(segment) for segment in path[1:].split("/")]
+    container = document
+    for segment in parents:
+        container = container[int(segment) if isinstance(container, list) else segment]
+    return container, last
+
+
+def apply(document, operations):
+    """
+    Apply operations from diff() to document in place.
+
+    Values are inserted by reference, as they appear in the operations. Path
+    segments address dicts by their string keys and lists by index.
+
+    Raises:
+        ValueError: If an operation or pointer is malformed, or replaces the
+            root with something other than a dict
+        KeyError, IndexError: If a path does not exist in the document
+    """
+    for operation in operations:
+        op, path = operation["op"], operation["path"]
+        if op not in OPERATIONS:
+            raise ValueError(
+                f"Unsupported patch operation: {op!r}. Use one of {', '.join(OPERATIONS)}."
+            )
+        if not path:
+            if op != "replace" or not isinstance(operation["value"], dict):
+                raise ValueError("Only 'replace' with a dict can target the document root")
+            document.clear()
+            document.update(operation["value"])
+            continue
+        container, key = _parent(document, path)
+        if isinstance(container, list):
+            if op == "add":
+                if key == "-":
+                    container.append(operation["value"])
+                else:
+                    container.insert(int(key), operation["value"])
+                continue
+            key = int(key)
+        if op == "remove":
+            del container[key]
+        else:
+            if op == "replace" and isinstance(container, dict) and key not in container:
+                raise KeyError(path)
+            container[key] = operation["value"]
@@ -0,0 +1,270 @@
+import re
+from fnmatch import fnmatchcase, translate
+from functools import lru_cache
+
+
+_MISSING = object()
+_GLOB_CHARS = "*?["
+
+
+def _split(path, separator):
+    """Split a dotted path, turning purely numeric parts into list indices too."""
+    return tuple(
+        (part, int(part) if part.lstrip("-").isdigit() else None)
+        for part in path.split(separator)
+    )
+
+
+def _step(current, part):
+    """Follow one path part, or return _MISSING if it does not exist."""
+    key, index = part
+    if isinstance(current, list):
+        if index is None:
+            return _MISSING
+        try:
+            return current[index]
+        except IndexError:
+            return _MISSING
+    try:
+        return current[key]
+    except (KeyError, TypeError):
+        return _MISSING
+
+
+class PathAccessor:
+    """
+    A dotted path parsed once into a reusable getter and setter.
+
+    Created by compile_path() or SmartDict.compile_path(). Numeric parts also
+    index into lists, so "items.0.name" reads the name of the first item.
+
+    Examples:
+        >>> city = compile_path("user.address.city")
+        >>> city.get({"user": {"address": {"city": "Paris"}}})
+        'Paris'
+        >>> city.get({"user": {}}, default="unknown")
+        'unknown'
+    """
+
+    __slots__ = ("path", "parts")
+
+    def __init__(self, path, separator="."):
+        self.path = path
+        self.parts = _split(path, separator)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.path!r})"
+
+    def __call__(self, mapping, default=_MISSING):
+        return self.get(mapping, default)
+
+    def get(self, mapping, default=_MISSING):
+        """
+        Read the value at this path.
+
+        Raises:
+            KeyError: If the path does not exist and no default is given
+        """
+        current = mapping
+        for part in self.parts:
+            current = _step(current, part)
+            if current is _MISSING:
+                if default is _MISSING:
+                    raise KeyError(self.path)
+                return default
+        return current
+
+    def set(self, mapping, value):
+        """
+        Write value at this path, creating missing intermediate dicts.
+
+        Raises:
+            KeyError: If an intermediate value exists but is not a container
+        """
+        current = mapping
+        for part in self.parts[:-1]:
+            child = _step(current, part)
+            if child is _MISSING:
+                if isinstance(current, list):
+                    raise KeyError(self.path)
+                child = current[part[0]] = {}
+            elif not isinstance(child, (dict, list)):
+                raise KeyError(self.path)
+            current = child
+        key, index = self.parts[-1]
+        if isinstance(current, list):
+            if index is None:
+                raise KeyError(self.path)
+            current[index] = value
+        else:
+            current[key] = value
+
+
+class PathSet:
+    """
+    Several dotted paths merged into a prefix tree for bulk reads.
+
+    Paths that share a prefix, such as "user.name" and "user.email", walk that
+    prefix once. Created and cached by SmartDict.get_many().
+    """
+
+    __slots__ = ("paths", "_tree")
+
+    def __init__(self, paths, separator="."):
+        self.paths = paths
+        # Each node is (children, positions): children maps a path part to a
+        # child node, positions lists the requested paths that end at the node.
+        self._tree = ({}, [])
+        for position, path in enumerate(paths):
+            node = self._tree
+            for part in _split(path, separator):
+                node = node[0].setdefault(part, ({}, []))
+            node[1].append(position)
+
+    def get_many(self, mapping, default=None, defaults=None):
+        """
+        Read every path in a single traversal.
+
+        Args:
+            mapping: The document to read from
+            default: Value used for paths that do not exist
+            defaults: Optional dict of per-path defaults, overriding default
+
+        Returns:
+            list: One value per path, in the order the paths were given
+        """
+        results = [_MISSING] * len(self.paths)
+        stack = [(mapping, self._tree)]
+        while stack:
+            current, (children, positions) = stack.pop()
+            for position in positions:
+                results[position] = current
+            for part, child in children.items():
+                value = _step(current, part)
+                if value is not _MISSING:
+                    stack.append((value, child))
+
+        for position, value in enumerate(results):
+            if value is _MISSING:
+                path = self.paths[position]
+                if defaults and path in defaults:
+                    results[position] = defaults[path]
+                else:
+                    results[position] = default
+        return results
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path, separator="."):
+    return PathAccessor(path, separator)
+
+
+@lru_cache(maxsize=256)
+def compile_paths(paths, separator="."):
+    return PathSet(paths, separator)
+
+
+def _match_path(pattern, path, partial):
+    """
+    Match path segments against glob segments, where "**" spans any number of
+    segments. With partial=True, also accept a path that a longer one could extend
+    into a match.
+    """
+    if not path:
+        return partial or all(head == "**" for head in pattern)
+    if not pattern:
+        return False
+    head = pattern[0]
+    if head == "**":
+        return _match_path(pattern[1:], path, partial) or _match_path(
+            pattern, path[1:], partial
+        )
+    return fnmatchcase(path[0], head) and _match_path(pattern[1:], path[1:], partial)
+
+
+class KeyFilter:
+    """
+    A set of keys and patterns, parsed once, for transform()'s include/exclude.
+
+    Every entry is one of:
+        - a plain key, matched against keys at any depth with a frozenset lookup
+        - a glob without a separator ("tmp_*"), matched against keys at any depth
+        - a dotted path, optionally with globs ("user.*.password", "logs.**"),
+          matched against the full path from the root. "*" matches one level and
+          "**" any number of levels; list items are addressed by their index.
+
+    A plain key containing the separator is also tried as a key name, so keys
+    that happen to contain dots keep working.
+    """
+
+    __slots__ = ("names", "name_pattern", "paths")
+
+    def __init__(self, keys, separator="."):
+        names, globs, paths = set(), [], []
+        for key in keys:
+            if not isinstance(key, str):
+                names.add(key)
+                continue
+            is_glob = any(character in key for character in _GLOB_CHARS)
+            if separator in key:
+                paths.append(tuple(key.split(separator)))
+            elif is_glob:
+                globs.append(translate(key))
+            if not is_glob:
+                names.add(key)
+        self.names = frozenset(names)
+        self.name_pattern = re.compile("|".join(globs)) if globs else None
+        self.paths = tuple(paths)
+
+    @classmethod
+    def of(cls, keys):
+        """Return keys as a KeyFilter, or None if keys is None."""
+        if keys is None or isinstance(keys, cls):
+            return keys
+        return cls(keys)
+
+    def matches_name(self, key):
+        try:
+            if key in self.names:
+                return True
+        except TypeError:
+            return False
+        return (
+            self.name_pattern is not None
+            and isinstance(key, str)
+            and self.name_pattern.match(key) is not None
+        )
+
+    def matches(self, key, path, is_key):
+        """Return True if a dict key (is_key) or list item at path is matched."""
+        if is_key and self.matches_name(key):
+            return True
+        return path is not None and any(
+            _match_path(pattern, path, False) for pattern in self.paths
+        )
+
+    def admits(self, key, path, is_key, parent_included):
+        """
+        Decide how an include filter treats one item.
+
+        A list item follows its list: it is included when the list was, since
+        key names only apply to dict keys.
+
+        Returns:
+            True if a path pattern matches, so the whole subtree is included;
+            False if the item is included but its children are still filtered;
+            None if it is not included by itself (see leads_to()).
+        """
+        if path is not None and any(
+            _match_path(pattern, path, False) for pattern in self.paths
+        ):
+            return True
+        if is_key:
+            return False if self.matches_name(key) else None
+        return False if parent_included else None
+
+    def leads_to(self, path):
+        """Return True if a path pattern could match below the container at path."""
+        return path is not None and any(
+            _match_path(pattern, path, True) for pattern in self.paths
+        )
@@ -0,0 +1,129 @@
+import operator
+from functools import partial, reduce
+
+
+COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+# Operators with their operands swapped, so that partial(REFLECTED[op], value)(item)
+# evaluates "item op value" as a single C call without a Python-level frame.
+REFLECTED = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.lt,
+    "<": operator.gt,
+    ">=": operator.le,
+    "<=": operator.ge,
+}
+
+COMBINERS = {"and": operator.and_, "or": operator.or_}
+
+
+def parse_where(predicate, operator, value, conditions, combine):
+    """
+    Validate the arguments accepted by the where() methods.
+
+    Exactly one filtering style must be used: a predicate function, a single
+    operator and value, or a list of (operator, value) conditions.
+
+    Returns:
+        tuple: (predicate, conditions, combine), where either predicate is set or
+        conditions is a list of (operator, value) pairs
+
+    Raises:
+        ValueError: If invalid arguments are provided
+    """
+    if combine not in COMBINERS:
+        raise ValueError(f"Unsupported combine mode: {combine}. Use 'and' or 'or'.")
+
+    match (predicate, operator, value, conditions):
+        case (None, str(), _, None):
+            conditions = [(operator, value)]
+        case (None, None, None, [_, *_]):
+            conditions = list(conditions)
+        case (_, None, None, None) if predicate is not None:
+            return predicate, None, combine
+        case _:
+            raise ValueError(
+                "Invalid arguments. Provide either a predicate function, an operator and value, or conditions."
+            )
+
+    for operator, value in conditions:
+        if operator == "between":
+            low, high = value
+        elif operator not in COMPARISONS:
+            raise ValueError(f"Unsupported operator: {operator}")
+    return None, conditions, combine
+
+
+def compile_condition(operator, value):
+    """
+    Resolve an operator string and value into a one-argument predicate.
+
+    Example:
+        >>> compile_condition(">", 3)(5)
+        True
+        >>> compile_condition("between", (1, 3))(4)
+        False
+    """
+    if operator == "between":
+        low, high = value
+        return lambda item: low <= item <= high
+    return partial(REFLECTED[operator], value)
+
+
+def compile_conditions(conditions, combine="and"):
+    """
+    Combine several (operator, value) conditions into one predicate.
+
+    Every operator is resolved once up front, so each element only pays for the
+    comparisons themselves. Evaluation short-circuits like "and"/"or".
+    """
+    tests = [compile_condition(operator, value) for operator, value in conditions]
+    if len(tests) == 1:
+        return tests[0]
+    if combine == "and":
+
+        def matches(item):
+            for test in tests:
+                if not test(item):
+                    return False
+            return True
+
+    else:
+
+        def matches(item):
+            for test in tests:
+                if test(item):
+                    return True
+            return False
+
+    return matches
+
+
+def conditions_mask(data, conditions, combine="and"):
+    """
+    Evaluate (operator, value) conditions as one boolean mask over an array.
+
+    Args:
+        data: A NumPy array
+        conditions: A list of (operator, value) pairs
+        combine: "and" or "or"
+
+    Returns:
+        numpy.ndarray: A boolean mask with one entry per element
+    """
+    masks = []
+    for operator, value in conditions:
+        if operator == "between":
+            low, high = value
+            masks.append((data >= low) & (data <= high))
+        else:
+            masks.append(COMPARISONS[operator](data, value))
+    return reduce(COMBINERS[combine], masks)
@@ -0,0 +1,157 @@
+import keyword
+from collections.abc import Mapping
+from functools import lru_cache
+
+from .smart_dict import SmartDict, _promote, _transform
+
+
+def _field_property(slot):
+    set = slot.__set__
+
+    def write(self, value):
+        set(self, _promote(value))
+
+    return property(slot.__get__, write)
+
+
+class SmartRecord(Mapping):
+    """
+    Base class for the fixed-schema records created by SmartDict.schema().
+
+    A record stores its values in __slots__ instead of a per-instance hash
+    table, so it has no dict overhead. It behaves like a SmartDict whose keys
+    can be read and reassigned but not added or removed.
+    """
+
+    __slots__ = ()
+    _fields = ()
+    _slots = {}
+
+    def __init__(self, data=(), **kwargs):
+        values = dict(data, **kwargs)
+        if values.keys() != self._slots.keys():
+            missing = [key for key in self._fields if key not in values]
+            unknown = [key for key in values if key not in self._slots]
+            raise TypeError(
+                f"{type(self).__name__} needs exactly the keys {list(self._fields)}; "
+                f"missing {missing}, unknown {unknown}"
+            )
+        for key, slot in self._slots.items():
+            slot.__set__(self, _promote(values[key]))
+
+    @classmethod
+    def _make(cls, values):
+        """Create a record from values given in field order, without checking keys."""
+        record = cls.__new__(cls)
+        for slot, value in zip(cls._slots.values(), values, strict=True):
+            slot.__set__(record, _promote(value))
+        return record
+
+    def __getitem__(self, key):
+        try:
+            slot = self._slots[key]
+        except (KeyError, TypeError):
+            raise KeyError(key) from None
+        return slot.__get__(self)
+
+    def __setitem__(self, key, value):
+        try:
+            slot = self._slots[key]
+        except (KeyError, TypeError):
+            raise KeyError(
+                f"{type(self).__name__} has a fixed schema without the key {key!r}"
+            ) from None
+        slot.__set__(self, _promote(value))
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def values(self):
+        return [slot.__get__(self) for slot in self._slots.values()]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __reduce__(self):
+        return _rebuild, (self._fields, type(self).__name__, self.values())
+
+    def to_dict(self):
+        """Copy the record into a SmartDict."""
+        return SmartDict(zip(self._fields, self.values()))
+
+    def transform(
+        self,
+        transform_function,
+        recursive=True,
+        include_keys=None,
+        exclude_keys=None,
+        executor=None,
+        batch_size=None,
+    ):
+        """Like SmartDict.transform(), but returns a record of the same schema."""
+        result = _transform(
+            self,
+            transform_function,
+            recursive,
+            include_keys,
+            exclude_keys,
+            False,
+            executor,
+            batch_size,
+        )
+        return self._make(result.values())
+
+    def transform_inplace(
+        self,
+        transform_function,
+        recursive=True,
+        include_keys=None,
+        exclude_keys=None,
+        executor=None,
+        batch_size=None,
+    ):
+        """Like SmartDict.transform_inplace(), writing the results into this record."""
+        _transform(
+            self,
+            transform_function,
+            recursive,
+            include_keys,
+            exclude_keys,
+            True,
+            executor,
+            batch_size,
+        )
+
+    # Merging can add keys, so the result is a SmartDict rather than a record.
+    merge = SmartDict.merge
+    get_many = SmartDict.get_many
+
+
+@lru_cache(maxsize=None)
+def record_class(fields, name="SmartRecord"):
+    """Create, or return the cached, record class for a tuple of field names."""
+    reserved = set(dir(SmartRecord))
+    for field in fields:
+        if not isinstance(field, str) or not field.isidentifier() or keyword.iskeyword(field):
+            raise ValueError(f"Schema keys must be identifiers, got {field!r}")
+        if field in reserved or field.startswith("_"):
+            raise ValueError(f"Schema key {field!r} clashes with a SmartRecord attribute")
+    if len(set(fields)) != len(fields):
+        raise ValueError(f"Schema keys must be unique, got {list(fields)}")
+
+    slot_names = tuple(f"_{index}" for index in range(len(fields)))
+    cls = type(name, (SmartRecord,), {"__slots__": slot_names, "_fields": fields})
+    cls._slots = {field: cls.__dict__[slot] for field, slot in zip(fields, slot_names)}
+    for field, slot in cls._slots.items():
+        setattr(cls, field, _field_property(slot))
+    return cls
+
+
+def _rebuild(fields, name, values):
+    return record_class(fields, name)._make(values)
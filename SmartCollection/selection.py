@@ -0,0 +1,197 @@
+import random
+from bisect import bisect_right, insort
+
+
+# Below this size sorting in C beats another Python-level partition pass.
+SORT_THRESHOLD = 32
+
+
+def select(values, k):
+    """
+    Return the k-th smallest element (0-based) in expected O(n) time.
+
+    Uses quickselect with a random pivot and a three-way partition, so runs of
+    equal values do not degrade it. The input is not modified.
+
+    Args:
+        values: A list of mutually comparable values
+        k: The rank of the element to return
+
+    Returns:
+        The element that would be at index k if the values were sorted
+
+    Example:
+        >>> select([7, 1, 5, 3], 1)
+        3
+    """
+    return multiselect(values, [k])[0]
+
+
+def multiselect(values, ranks):
+    """
+    Return the elements at several ranks using one shared partitioning pass.
+
+    Each partition step only recurses into the sides that still contain a
+    requested rank, so asking for many ranks costs little more than asking for one.
+
+    Args:
+        values: A list of mutually comparable values
+        ranks: The 0-based ranks to return
+
+    Returns:
+        list: The elements at the requested ranks, in the order the ranks were given
+
+    Example:
+        >>> multiselect([9, 2, 7, 4, 5], [0, 2, 4])
+        [2, 5, 9]
+    """
+    found = {}
+    stack = [(values, sorted(set(ranks)), 0)]
+
+    while stack:
+        part, wanted, offset = stack.pop()
+        if len(part) <= SORT_THRESHOLD:
+            ordered = sorted(part)
+            for rank in wanted:
+                found[rank] = ordered[rank - offset]
+            continue
+
+        pivot = random.choice(part)
+        lows = [item for item in part if item < pivot]
+        highs = [item for item in part if pivot < item]
+        pivot_start = offset + len(lows)
+        pivot_stop = offset + len(part) - len(highs)
+
+        high_ranks = []
+        low_ranks = []
+        for rank in wanted:
+            if rank < pivot_start:
+                low_ranks.append(rank)
+            elif rank < pivot_stop:
+                found[rank] = pivot
+            else:
+                high_ranks.append(rank)
+        if low_ranks:
+            stack.append((lows, low_ranks, offset))
+        if high_ranks:
+            stack.append((highs, high_ranks, pivot_stop))
+
+    return [found[rank] for rank in ranks]
+
+
+def interpolate(q, length, lookup):
+    """
+    Linearly interpolate the q-th quantile between the two closest ranks.
+
+    When the quantile falls exactly on a rank the element is returned unchanged.
+
+    Args:
+        q: The quantile, between 0 and 1
+        length: The number of values
+        lookup: A function returning the element at a given rank
+    """
+    position = (length - 1) * q
+    lower = int(position)
+    fraction = position - lower
+    if fraction == 0:
+        return lookup(lower)
+    low, high = lookup(lower), lookup(lower + 1)
+    return low + (high - low) * fraction
+
+
+def quantile_ranks(q, length):
+    """Return the ranks needed to interpolate the q-th quantile."""
+    position = (length - 1) * q
+    lower = int(position)
+    if position == lower:
+        return [lower]
+    return [lower, lower + 1]
+
+
+class P2Quantile:
+    """
+    Streaming estimate of a single quantile using the P-squared algorithm.
+
+    Keeps five markers and adjusts them as values arrive, so memory use is
+    constant no matter how many values are added. The estimate is exact for
+    fewer than five values.
+
+    Reference: R. Jain and I. Chlamtac, "The P2 algorithm for dynamic
+    calculation of quantiles and histograms without storing observations" (1985).
+
+    Example:
+        >>> sketch = P2Quantile(0.5)
+        >>> for value in range(1, 101):
+        ...     sketch.add(value)
+        >>> round(sketch.value())
+        50
+    """
+
+    def __init__(self, q):
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        self.q = q
+        self.count = 0
+        self._heights = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5]
+        self._increments = [0, q / 2, q, (1 + q) / 2, 1]
+
+    def add(self, value):
+        """Add one observation to the sketch."""
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = bisect_right(heights, value) - 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i, step):
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i, step):
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+    def value(self):
+        """
+        Return the current estimate.
+
+        Raises:
+            ValueError: If no values have been added
+        """
+        if not self.count:
+            raise ValueError("Cannot calculate quantile of empty list")
+        if self.count <= 5:
+            return interpolate(self.q, self.count, self._heights.__getitem__)
+        return self._heights[2]
@@ -1,77 +1,390 @@
+import json
+
+from . import patch
+from .parallel import map_batched
+from .paths import KeyFilter, compile_path, compile_paths
+from .streaming import CHUNK_SIZE, load_paths
+
+
+def _promote(value, memo=None):
+    """
+    Return value as a SmartDict stores it.
+
+    A plain dict is copied into a SmartDict, and so is every plain dict nested
+    in its values, iteratively and with shared and cyclic references kept.
+    Leaves, lists and other dict subclasses are returned as they are, since
+    converting those would change how they behave. memo maps the ids of plain
+    dicts already copied to their copies.
+    """
+    if type(value) is not dict:
+        return value
+    if memo is None:
+        memo = {}
+    if id(value) in memo:
+        return memo[id(value)]
+    result = memo[id(value)] = dict.__new__(SmartDict)
+    stack = [(value, result)]
+    while stack:
+        source, target = stack.pop()
+        for key, item in source.items():
+            if type(item) is dict:
+                if id(item) in memo:
+                    item = memo[id(item)]
+                else:
+                    copy = memo[id(item)] = dict.__new__(SmartDict)
+                    stack.append((item, copy))
+                    item = copy
+            dict.__setitem__(target, key, item)
+    return result
+
+
+class _Frame:
+    """A container being transformed, and how far through its items the walk is."""
+
+    __slots__ = (
+        "source",
+        "result",
+        "items",
+        "is_dict",
+        "changed",
+        "pending",
+        "path",
+        "included",
+    )
+
+    def __init__(self, source, result, is_dict, path, included):
+        self.source = source
+        self.result = result
+        self.items = iter(source.items()) if is_dict else enumerate(source)
+        self.is_dict = is_dict
+        self.changed = False
+        self.pending = None
+        self.path = path
+        self.included = included
+
+
+def _transform_tree(
+    root, transform_function, recursive, include_keys, exclude_keys, inplace
+):
+    """
+    Walk a nested document iteratively, applying transform_function to the leaves.
+
+    Containers are memoized by id, so shared and cyclic references are only
+    walked once. A container referenced again while it is still being walked
+    is part of a cycle and is never replaced by its original, since the new
+    copy has already been handed out. Unchanged lists and SmartDicts are
+    reused; an unchanged dict of another type is still copied, so every dict
+    the walk returns is a SmartDict.
+
+    include_keys and exclude_keys are KeyFilters or None. Items they leave out
+    are stored by reference without being walked, except containers that an
+    include path pattern could still match inside, which are walked without
+    being included themselves (their frame's included is None). Paths from the
+    root are only built when one of the filters has path patterns.
+    """
+    memo = {}
+    cyclic = set()
+    track_paths = any(keys is not None and keys.paths for keys in (include_keys, exclude_keys))
+
+    def open_frame(container, is_dict, path, included):
+        if inplace:
+            result = container
+        else:
+            result = SmartDict() if is_dict else []
+        memo[id(container)] = result
+        return _Frame(container, result, is_dict, path, included)
+
+    def store(frame, key, old, new):
+        if new is not old:
+            frame.changed = True
+        if frame.is_dict:
+            if not inplace or new is not old:
+                frame.result[key] = new
+        elif not inplace:
+            frame.result.append(new)
+        elif new is not old:
+            frame.result[key] = new
+
+    stack = [open_frame(root, True, () if track_paths else None, include_keys is None)]
+    open_ids = {id(root)}
+    while stack:
+        frame = stack[-1]
+        for key, value in frame.items:
+            path = None if frame.path is None else (*frame.path, str(key))
+            included = frame.included or include_keys.admits(
+                key, path, frame.is_dict, frame.included is False
+            )
+            walk = recursive and isinstance(value, (dict, list))
+            if (
+                included is None and not (walk and include_keys.leads_to(path))
+            ) or (
+                exclude_keys is not None
+                and exclude_keys.matches(key, path, frame.is_dict)
+            ):
+                store(frame, key, value, value)
+            elif walk:
+                if id(value) in memo:
+                    if id(value) in open_ids:
+                        cyclic.add(id(value))
+                    store(frame, key, value, memo[id(value)])
+                    continue
+                frame.pending = (key, value)
+                stack.append(open_frame(value, isinstance(value, dict), path, included))
+                open_ids.add(id(value))
+                break
+            else:
+                store(frame, key, value, transform_function(value))
+        else:
+            stack.pop()
+            open_ids.discard(id(frame.source))
+            result = frame.result
+            if not (
+                inplace or frame.changed or id(frame.source) in cyclic or not stack
+            ) and (not frame.is_dict or isinstance(frame.source, SmartDict)):
+                result = frame.source
+            memo[id(frame.source)] = result
+            if stack:
+                parent = stack[-1]
+                key, value = parent.pending
+                store(parent, key, value, result)
+
+    return memo[id(root)]
+
+
+def _transform(
+    root,
+    transform_function,
+    recursive,
+    include_keys,
+    exclude_keys,
+    inplace,
+    executor=None,
+    batch_size=None,
+):
+    """
+    Run _transform_tree, computing the leaf values on executor if one is given.
+
+    The walk visits leaves in the same order every time, so a first in-place
+    pass with the identity function collects them without changing anything,
+    the executor transforms them in batches, and a second pass hands the
+    results back out in order.
+    """
+    include_keys = KeyFilter.of(include_keys)
+    exclude_keys = KeyFilter.of(exclude_keys)
+    if executor is None:
+        return _transform_tree(
+            root, transform_function, recursive, include_keys, exclude_keys, inplace
+        )
+    leaves = []
+
+    def collect(value):
+        leaves.append(value)
+        return value
+
+    _transform_tree(root, collect, recursive, include_keys, exclude_keys, True)
+    results = iter(map_batched(transform_function, leaves, executor, batch_size))
+    return _transform_tree(
+        root, lambda value: next(results), recursive, include_keys, exclude_keys, inplace
+    )
+
+
 class SmartDict(dict):
 
+    def __init__(self, *args, **kwargs):
+        """
+        Create a SmartDict like a dict.
+
+        Nested plain dicts are copied into SmartDicts as they are stored, here
+        and by item assignment, update() and setdefault(), so every dict
+        reachable through keys is a SmartDict. Reads never rewrite the
+        container. Because of the copy, changes made later through a
+        reference to the original nested dict are not seen by the SmartDict.
+        Dicts inside lists, and dict subclasses such as OrderedDict, are kept
+        as they are.
+        """
+        super().__init__(*args, **kwargs)
+        # A document that contains itself maps back to this SmartDict.
+        memo = {id(args[0]): self} if len(args) == 1 and type(args[0]) is dict else {}
+        for key, value in dict.items(self):
+            if type(value) is dict:
+                dict.__setitem__(self, key, _promote(value, memo))
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, _promote(value))
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
     def __getattr__(self, key):
-        try:
-            match self[key]:
-                case str():
-                    return self[key]
-                case dict():
-                    return SmartDict(self[key])
-                case _:
-                    return self[key]
+        """
+        Read a key as an attribute, e.g. config.db.host.
+
+        Nested dicts were made SmartDicts when they were stored, so attribute
+        chains neither copy nor change anything, and writes through a chain
+        (config.db.port = 5432) land in this document.
 
+        Examples:
+            >>> config = SmartDict({"db": {"host": "localhost"}})
+            >>> config.db.host
+            'localhost'
+            >>> config.db is config.db, isinstance(config.db, dict)
+            (True, True)
+            >>> config.db.port = 5432
+            >>> config["db"]
+            {'host': 'localhost', 'port': 5432}
+        """
+        try:
+            return self[key]
         except KeyError:
             raise AttributeError(
                 f"'{self.__class__.__name__}' object has no attribute '{key}'"
-            )
+            ) from None
 
     def __setattr__(self, key, value):
         self[key] = value
 
+    @classmethod
+    def from_json_stream(cls, fp, paths=None, separator=".", chunk_size=CHUNK_SIZE):
+        """
+        Load selected parts of a JSON document from a file, reading it in chunks.
+
+        The file is scanned once, chunk_size characters at a time. Only the
+        values at the requested paths are decoded; everything else is skipped
+        over without being built, so memory use is bounded by the size of the
+        requested values rather than the size of the file.
+
+        Args:
+            fp: A file object opened in text or binary (UTF-8) mode
+            paths: Dotted paths to load. If None, the whole document is loaded.
+            separator: Separator between path parts
+            chunk_size: Number of characters (or bytes) read at a time
+
+        Returns:
+            A new SmartDict holding the requested values under their paths.
+            Paths that do not exist in the document are left out.
+
+        Raises:
+            ValueError: If the document is not valid JSON or its root is not an object
+
+        Examples:
+            >>> import io
+            >>> fp = io.StringIO('{"meta": {"version": 3, "owner": "ops"}, "rows": [1, 2, 3]}')
+            >>> meta = SmartDict.from_json_stream(fp, paths=["meta.version", "meta.owner"])
+            >>> meta
+            {'meta': {'version': 3, 'owner': 'ops'}}
+            >>> meta.meta.version
+            3
+        """
+        if paths is None:
+            return cls(json.load(fp))
+        return cls(load_paths(fp, paths, separator, chunk_size))
+
     def transform(
-        self, transform_function, recursive=True, include_keys=None, exclude_keys=None
+        self,
+        transform_function,
+        recursive=True,
+        include_keys=None,
+        exclude_keys=None,
+        executor=None,
+        batch_size=None,
     ):
         """
         Apply a transformation function to dictionary values.
 
+        The document is walked with an explicit stack, so nesting depth is not
+        limited by the recursion limit. Lists nested in lists are walked too.
+        A dict or list that is reachable through several paths, including
+        cyclic references, is transformed once and the result keeps the same
+        sharing. Nested lists and SmartDicts whose values all come back
+        unchanged are reused as they are instead of being copied; other nested
+        dicts that the walk reaches are always returned as SmartDicts, so the
+        type of a nested result does not depend on whether its values changed.
+        Subtrees left out by include_keys or exclude_keys keep their own type.
+
         Args:
             transform_function: Function to apply to each value
-            recursive: If True, apply to nested dictionaries as well
-            include_keys: List of keys to include (if None, include all)
-            exclude_keys: List of keys to exclude
+            recursive: If True, apply to nested dictionaries and lists as well
+            include_keys: Keys to include (if None, include all). Besides plain
+                    keys, entries can be globs on key names ("tmp_*") or dotted
+                    paths from the root, with "*" for one level and "**" for
+                    any number ("users.*.email"). A matching dotted path includes
+                    everything below it.
+            exclude_keys: Keys to exclude, in the same forms. Excluded
+                    values, including whole subtrees, are kept by reference
+                    and not walked.
+            executor: Optional concurrent.futures executor. The leaves are
+                    transformed on it in batches and put back in their original
+                    order, so the result is the same as without one. Use a
+                    ProcessPoolExecutor for CPU-bound functions, which must then
+                    be picklable. Documents with fewer than TRANSFORM_THRESHOLD
+                    leaves are transformed sequentially.
+            batch_size: Number of leaves per executor task (default: about
+                    four batches per CPU)
 
         Returns:
             A new SmartDict with transformed values
         """
-        result = SmartDict()
-
-        for key, value in self.items():
-            if exclude_keys and key in exclude_keys:
-                result[key] = value
-                continue
-
-            if include_keys is not None and key not in include_keys:
-                result[key] = value
-                continue
-
-            if recursive and isinstance(value, dict):
-                result[key] = SmartDict(value).transform(
-                    transform_function, recursive, include_keys, exclude_keys
-                )
-            elif recursive and isinstance(value, list):
-                new_list = []
-                for item in value:
-                    if isinstance(item, dict):
-                        new_list.append(
-                            SmartDict(item).transform(
-                                transform_function,
-                                recursive,
-                                include_keys,
-                                exclude_keys,
-                            )
-                        )
-                    else:
-                        new_list.append(transform_function(item))
-                result[key] = new_list
-            else:
-                result[key] = transform_function(value)
+        return _transform(
+            self,
+            transform_function,
+            recursive,
+            include_keys,
+            exclude_keys,
+            False,
+            executor,
+            batch_size,
+        )
 
-        return result
+    def transform_inplace(
+        self,
+        transform_function,
+        recursive=True,
+        include_keys=None,
+        exclude_keys=None,
+        executor=None,
+        batch_size=None,
+    ):
+        """
+        Apply a transformation function to dictionary values without copying.
+
+        Takes the same arguments as transform(), but writes the results back
+        into this dict and its nested dicts and lists. Only values that
+        actually change are reassigned.
+        """
+        _transform(
+            self,
+            transform_function,
+            recursive,
+            include_keys,
+            exclude_keys,
+            True,
+            executor,
+            batch_size,
+        )
 
     def merge(self, other, resolver=None):
         """
         Merge another dictionary into this one with custom conflict resolution.
 
+        The result starts as a shallow copy of the top level of self, so that
+        step is proportional to the number of keys in self. Below the top
+        level, only the dicts on the paths that other changes are copied, each
+        once and shallowly; every other nested subtree of self is shared with
+        the result by reference rather than walked. Values from other are
+        shared too, except plain dicts, which are stored as SmartDicts like in
+        any SmartDict. Because of that sharing, copy a nested value before
+        mutating it in place if the inputs must not change.
+
         Args:
             other: Another dictionary to merge with
             resolver: Function to resolve conflicts. Takes (key, self_value, other_value)
@@ -80,24 +393,136 @@ class SmartDict(dict):
         Returns:
             A new SmartDict with merged values
         """
-        result = SmartDict(self.copy())
+        result = SmartDict(self)
 
         for key, other_value in other.items():
             if key in result:
                 self_value = result[key]
 
+                if self_value is other_value and resolver is None:
+                    continue
                 if isinstance(self_value, dict) and isinstance(other_value, dict):
-                    result[key] = SmartDict(self_value).merge(
-                        SmartDict(other_value), resolver
-                    )
+                    result[key] = SmartDict.merge(self_value, other_value, resolver)
                 elif resolver:
                     result[key] = resolver(key, self_value, other_value)
                 else:
                     result[key] = other_value
             else:
-                if isinstance(other_value, dict):
-                    result[key] = SmartDict(other_value)
-                else:
-                    result[key] = other_value
+                result[key] = other_value
 
         return result
+
+    def diff(self, other):
+        """
+        Compute a compact delta that turns this dict into other.
+
+        Subtrees that are the same object in both dicts are skipped by
+        identity, so the cost scales with the size of the change when the two
+        versions share their unchanged parts, as the results of merge() and
+        transform() do.
+
+        Args:
+            other: The dictionary to diff against
+
+        Returns:
+            list: JSON Patch style operations ({"op": "add" | "remove" |
+            "replace", "path": JSON pointer, "value": ...}) for apply()
+
+        Raises:
+            TypeError: If a dict in either document has a key that is not a
+                string, since a JSON pointer could not address it
+
+        Examples:
+            >>> old = SmartDict({"db": {"host": "a", "port": 1}, "debug": True})
+            >>> old.diff({"db": {"host": "b", "port": 1}})
+            [{'op': 'remove', 'path': '/debug'}, {'op': 'replace', 'path': '/db/host', 'value': 'b'}]
+        """
+        return patch.diff(self, other)
+
+    def apply(self, delta):
+        """
+        Apply a delta from diff() to this dict in place.
+
+        Raises:
+            ValueError: If the delta contains an unsupported operation or path
+            KeyError: If a path to remove or replace does not exist
+            IndexError: If a list index in a path does not exist
+        """
+        patch.apply(self, delta)
+
+    @staticmethod
+    def schema(keys, name="SmartRecord"):
+        """
+        Create a compact record class for dicts that all share the same keys.
+
+        Instances store only their values, in __slots__, with no per-instance
+        hash table, so a record takes a fraction of the memory of a SmartDict
+        with the same items. They support the
+        read-only mapping protocol plus item assignment to existing keys,
+        attribute access (plain dicts are stored as SmartDicts),
+        transform(), transform_inplace(), merge() and get_many(). Keys cannot
+        be added or removed. The class is cached per tuple of keys, so calling
+        schema() again with the same keys returns the same class.
+
+        Args:
+            keys: Field names, which must be valid identifiers
+            name: Name of the generated class
+
+        Returns:
+            A subclass of SmartRecord
+
+        Raises:
+            ValueError: If a key is not an identifier, is repeated, or clashes
+                with a record method
+
+        Examples:
+            >>> Point = SmartDict.schema(["x", "y"])
+            >>> p = Point(x=1, y=2)
+            >>> p.x, p["y"]
+            (1, 2)
+            >>> p.transform(lambda v: v * 10)
+            SmartRecord({'x': 10, 'y': 20})
+        """
+        from .records import record_class
+
+        return record_class(tuple(keys), name)
+
+    @staticmethod
+    def compile_path(path, separator="."):
+        """
+        Parse a dotted path once into a reusable accessor.
+
+        The returned PathAccessor has get(mapping, default) and
+        set(mapping, value) methods and can be applied to any number of
+        documents. Accessors are cached, so compiling the same path again is a
+        dictionary lookup.
+
+        Examples:
+            >>> email = SmartDict.compile_path("user.contact.email")
+            >>> email.get(SmartDict({"user": {"contact": {"email": "a@b.c"}}}))
+            'a@b.c'
+        """
+        return compile_path(path, separator)
+
+    def get_many(self, paths, default=None, defaults=None, separator="."):
+        """
+        Read several dotted paths in a single traversal.
+
+        The paths are merged into a prefix tree, so a prefix shared by several
+        paths is walked only once. The tree is cached per tuple of paths.
+
+        Args:
+            paths: Iterable of dotted paths
+            default: Value used for paths that do not exist
+            defaults: Optional dict of per-path defaults, overriding default
+            separator: Separator between path parts
+
+        Returns:
+            list: One value per path, in the order given
+
+        Examples:
+            >>> user = SmartDict({"name": "Ada", "address": {"city": "London"}})
+            >>> user.get_many(["name", "address.city", "address.zip"], defaults={"address.zip": "-"})
+            ['Ada', 'London', '-']
+        """
+        return compile_paths(tuple(paths), separator).get_many(self, default, defaults)
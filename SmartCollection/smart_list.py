@@ -1,6 +1,25 @@
+import operator
 from collections import Counter
+from collections.abc import Iterable
 from typing import Optional
 
+from .parallel import (
+    chunk_slices,
+    count_chunk,
+    filter_chunk,
+    map_chunks,
+    sum_chunk,
+    use_parallel,
+)
+from .predicates import COMPARISONS, compile_conditions, parse_where
+from .selection import P2Quantile, interpolate, multiselect, quantile_ranks, select
+from .stats_cache import StatsCache
+
+
+def is_scalar(value):
+    """Return True if value should be broadcast to every element rather than zipped."""
+    return isinstance(value, (str, bytes)) or not isinstance(value, Iterable)
+
 
 class SmartList(list):
     """
@@ -17,93 +36,296 @@ class SmartList(list):
         [4, 5]
         >>> nums + SmartList([10, 20, 30, 40, 50])
         [11, 22, 33, 44, 55]
+        >>> nums * 2
+        [2, 4, 6, 8, 10]
+
+    The arithmetic operators work element-wise, including the in-place forms:
+    use extend() to concatenate lists.
+
+    Statistics are cached between calls: mean(), mode() and repeated order
+    statistics keep running aggregates that the mutating list methods update
+    incrementally, so calling them again after a small append is cheap.
     """
 
+    _stats = None
+
+    @classmethod
+    def from_numeric(cls, values, dtype="float64"):
+        """
+        Create a list backed by a contiguous NumPy array.
+
+        Element-wise operators and mean/median/mode then run as vectorized kernels.
+        If NumPy is not installed or the values are not numeric, a regular
+        SmartList is returned instead, so callers keep the usual list semantics.
+
+        Args:
+            values: An iterable of numbers
+            dtype: The NumPy dtype used to store the values
+
+        Returns:
+            NumericSmartList or SmartList: The array-backed list, or a plain
+            SmartList when the values cannot be stored as numbers
+
+        Raises:
+            ValueError: If storing the values as dtype would change them, such
+                as floats with a fractional part stored as an integer dtype, or
+                integers above 2**53 stored as float64
+
+        Example:
+            >>> SmartList.from_numeric([1, 2, 3], dtype="int64") * SmartList([4, 5, 6])
+            [4, 10, 18]
+            >>> SmartList.from_numeric(["a", "b"])
+            ['a', 'b']
+        """
+        from .numeric_list import NumericSmartList, to_numeric_array
+
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        array = to_numeric_array(values, dtype)
+        if array is None:
+            return cls(values)
+        return NumericSmartList(array)
+
+    def lazy(self):
+        """
+        Start a deferred expression over this list.
+
+        Operators and where() filters applied to the result are fused into a
+        single pass that runs on iteration, len(), or collect().
+
+        Returns:
+            LazySmartList: An expression wrapping this list
+
+        Example:
+            >>> (SmartList([1, 2, 3]).lazy() * SmartList([4, 5, 6])).where(operator=">", value=5).collect()
+            [10, 18]
+        """
+        from .lazy import LazySmartList
+
+        return LazySmartList(self)
+
+    def _elementwise(self, other, function, strict=True, reflected=False):
+        """
+        Apply a binary function to corresponding elements, broadcasting scalars.
+
+        Args:
+            other: A list-like object, or a scalar applied to every element
+            function: A function from the operator module
+            strict: If True, raise ValueError when the lengths differ. If False,
+                stop at the end of the shorter operand.
+            reflected: If True, compute function(other_item, item) instead
+
+        Returns:
+            list: The results, one per element
+
+        Raises:
+            ValueError: If strict is True and the lengths differ
+        """
+        if is_scalar(other):
+            if reflected:
+                return [function(other, a) for a in self]
+            return [function(a, other) for a in self]
+        if strict and hasattr(other, "__len__") and len(other) != len(self):
+            raise ValueError(
+                f"Length mismatch: {len(self)} != {len(other)}. Pass strict=False to truncate."
+            )
+        pairs = zip(self, other, strict=strict)
+        if reflected:
+            return [function(b, a) for a, b in pairs]
+        return [function(a, b) for a, b in pairs]
+
+    def _update(self, other, function):
+        """Write the results of an element-wise operation back into this list."""
+        values = self._elementwise(other, function)
+        self._stats = None
+        super().__setitem__(slice(None), values)
+        return self
+
+    def add(self, other, strict=True):
+        """
+        Add corresponding elements of two lists, or a scalar to every element.
+
+        Args:
+            other: Another list-like object of the same length, or a scalar
+            strict: If False, truncate to the shorter operand instead of raising
+
+        Returns:
+            SmartList: A new SmartList with the sum of corresponding elements
+
+        Raises:
+            ValueError: If strict is True and the lengths differ
+
+        Example:
+            >>> SmartList([1, 2, 3]).add([10, 20], strict=False)
+            [11, 22]
+        """
+        return type(self)(self._elementwise(other, operator.add, strict))
+
+    def sub(self, other, strict=True):
+        """Subtract element-wise; see add() for the arguments."""
+        return type(self)(self._elementwise(other, operator.sub, strict))
+
+    def mul(self, other, strict=True):
+        """Multiply element-wise; see add() for the arguments."""
+        return type(self)(self._elementwise(other, operator.mul, strict))
+
+    def truediv(self, other, strict=True):
+        """Divide element-wise; see add() for the arguments."""
+        return type(self)(self._elementwise(other, operator.truediv, strict))
+
+    def floordiv(self, other, strict=True):
+        """Floor divide element-wise; see add() for the arguments."""
+        return type(self)(self._elementwise(other, operator.floordiv, strict))
+
     def __add__(self, other):
         """
         Add corresponding elements of two lists.
 
         Args:
-            other: Another list-like object of the same length
+            other: Another list-like object of the same length, or a scalar
+                that is added to every element
 
         Returns:
             SmartList: A new SmartList with the sum of corresponding elements
 
+        Raises:
+            ValueError: If the lengths differ
+
         Example:
             >>> SmartList([1, 2, 3]) + SmartList([4, 5, 6])
             [5, 7, 9]
+            >>> SmartList([1, 2, 3]) + 10
+            [11, 12, 13]
         """
-        return type(self)([a + b for a, b in zip(self, other)])
+        return self.add(other)
 
     def __sub__(self, other):
         """
         Subtract corresponding elements of another list from this list.
 
         Args:
-            other: Another list-like object of the same length
+            other: Another list-like object of the same length, or a scalar
+                that is subtracted from every element
 
         Returns:
             SmartList: A new SmartList with the difference of corresponding elements
 
+        Raises:
+            ValueError: If the lengths differ
+
         Example:
             >>> SmartList([10, 20, 30]) - SmartList([1, 2, 3])
             [9, 18, 27]
         """
-        return type(self)([a - b for a, b in zip(self, other)])
+        return self.sub(other)
 
     def __mul__(self, other):
         """
         Multiply corresponding elements of two lists.
 
         Args:
-            other: Another list-like object of the same length
+            other: Another list-like object of the same length, or a scalar
+                that multiplies every element
 
         Returns:
             SmartList: A new SmartList with the product of corresponding elements
 
+        Raises:
+            ValueError: If the lengths differ
+
         Example:
             >>> SmartList([1, 2, 3]) * SmartList([4, 5, 6])
             [4, 10, 18]
+            >>> SmartList([1, 2, 3]) * 2
+            [2, 4, 6]
         """
-        return type(self)([a * b for a, b in zip(self, other)])
+        return self.mul(other)
 
     def __truediv__(self, other):
         """
         Divide corresponding elements of this list by another list.
 
         Args:
-            other: Another list-like object of the same length
+            other: Another list-like object of the same length, or a scalar
+                that divides every element
 
         Returns:
             SmartList: A new SmartList with the quotient of corresponding elements
 
+        Raises:
+            ValueError: If the lengths differ
+
         Example:
             >>> SmartList([10, 20, 30]) / SmartList([2, 5, 10])
             [5.0, 4.0, 3.0]
         """
-        return type(self)([a / b for a, b in zip(self, other)])
+        return self.truediv(other)
 
     def __floordiv__(self, other):
         """
         Floor divide corresponding elements of this list by another list.
 
         Args:
-            other: Another list-like object of the same length
+            other: Another list-like object of the same length, or a scalar
+                that floor divides every element
 
         Returns:
             SmartList: A new SmartList with the floor quotient of corresponding elements
 
+        Raises:
+            ValueError: If the lengths differ
+
         Example:
             >>> SmartList([10, 20, 30]) // SmartList([3, 7, 4])
             [3, 2, 7]
         """
-        return type(self)([a // b for a, b in zip(self, other)])
+        return self.floordiv(other)
+
+    def __radd__(self, other):
+        return type(self)(self._elementwise(other, operator.add, reflected=True))
+
+    def __rsub__(self, other):
+        return type(self)(self._elementwise(other, operator.sub, reflected=True))
+
+    def __rmul__(self, other):
+        return type(self)(self._elementwise(other, operator.mul, reflected=True))
+
+    def __rtruediv__(self, other):
+        return type(self)(self._elementwise(other, operator.truediv, reflected=True))
+
+    def __rfloordiv__(self, other):
+        return type(self)(self._elementwise(other, operator.floordiv, reflected=True))
+
+    def __iadd__(self, other):
+        """
+        Add element-wise in place, reusing this list instead of allocating a new one.
+
+        Example:
+            >>> nums = SmartList([1, 2, 3])
+            >>> nums += 1
+            >>> nums
+            [2, 3, 4]
+        """
+        return self._update(other, operator.add)
+
+    def __isub__(self, other):
+        return self._update(other, operator.sub)
+
+    def __imul__(self, other):
+        return self._update(other, operator.mul)
+
+    def __itruediv__(self, other):
+        return self._update(other, operator.truediv)
+
+    def __ifloordiv__(self, other):
+        return self._update(other, operator.floordiv)
 
     def __getitem__(self, key):
         """
         Enhanced indexing and slicing behavior.
 
-        Provides custom handling for slices with step values.
+        Slices support the full slice protocol, including negative starts, stops
+        and steps, and are copied at native speed into a new SmartList.
 
         Args:
             key: An index or slice object
@@ -114,24 +336,136 @@ class SmartList(list):
         Example:
             >>> SmartList([1, 2, 3, 4, 5])[1:5:2]
             [2, 4]
+            >>> SmartList([1, 2, 3, 4, 5])[::-2]
+            [5, 3, 1]
         """
         if isinstance(key, slice):
-            start, stop, step = key.start, key.stop, key.step
-            if step is not None:
-                result = []
-                i = start if start is not None else 0
-                while i < (stop if stop is not None else len(self)) and i < len(self):
-                    result.append(self[i])
-                    i += step
-                return type(self)(result)
-            return super().__getitem__(key)
+            return type(self)(super().__getitem__(key))
         else:
             return super().__getitem__(key)
 
-    def mean(self):
+    def view(self, key):
+        """
+        Return a zero-copy view onto a slice of this list.
+
+        The view shares storage with the list: reading it, writing to it and
+        computing statistics over it never copies the window.
+
+        Args:
+            key: A slice object
+
+        Returns:
+            SmartListView: A view onto the selected elements
+
+        Example:
+            >>> SmartList([1, 2, 3, 4, 5, 6]).view(slice(None, None, 2)).median()
+            3
+        """
+        from .view import SmartListView
+
+        return SmartListView(self, range(len(self))[key])
+
+    def append(self, item):
+        """Append an item, updating any cached statistics."""
+        super().append(item)
+        if self._stats is not None:
+            self._stats.add(item)
+
+    def extend(self, items):
+        """Extend the list with items, updating any cached statistics."""
+        if self._stats is None:
+            return super().extend(items)
+        items = list(items)
+        super().extend(items)
+        self._stats.add_many(items)
+
+    def insert(self, index, item):
+        """Insert an item before index, updating any cached statistics."""
+        super().insert(index, item)
+        if self._stats is not None:
+            self._stats.add(item)
+
+    def pop(self, index=-1):
+        """Remove and return the item at index, updating any cached statistics."""
+        item = super().pop(index)
+        if self._stats is not None:
+            self._stats.discard(item)
+        return item
+
+    def remove(self, item):
+        """Remove the first occurrence of item, updating any cached statistics."""
+        if self._stats is None:
+            return super().remove(item)
+        self.pop(self.index(item))
+
+    def clear(self):
+        """Remove all items and drop the cached statistics."""
+        super().clear()
+        self._stats = None
+
+    def __setitem__(self, key, value):
+        if self._stats is None:
+            return super().__setitem__(key, value)
+        old = super().__getitem__(key)
+        if isinstance(key, slice):
+            value = list(value)
+            super().__setitem__(key, value)
+            self._stats.discard_many(old)
+            self._stats.add_many(value)
+        else:
+            super().__setitem__(key, value)
+            self._stats.discard(old)
+            self._stats.add(value)
+
+    def __delitem__(self, key):
+        if self._stats is None:
+            return super().__delitem__(key)
+        old = super().__getitem__(key)
+        super().__delitem__(key)
+        if isinstance(key, slice):
+            self._stats.discard_many(old)
+        else:
+            self._stats.discard(old)
+
+    def __getstate__(self):
+        # The statistics cache describes this list's items: a copy or unpickled
+        # list re-appends its items and must start without one.
+        state = self.__dict__.copy()
+        state.pop("_stats", None)
+        return state
+
+    def _statistics(self):
+        if self._stats is None:
+            self._stats = StatsCache()
+        return self._stats
+
+    def _ordered_index(self):
+        """
+        Return the cached sorted copy of the list, or None if it is not worth building yet.
+
+        The index is only built on the second order statistic request, so a
+        one-off median() keeps the O(n) quickselect path without the extra memory.
+        """
+        stats = self._statistics()
+        if stats.ordered is None:
+            stats.order_queries += 1
+            if stats.order_queries < 2:
+                return None
+            stats.ordered = sorted(self)
+        return stats.ordered
+
+    def _chunks(self, workers):
+        """Split the list into plain-list chunks to send to worker processes."""
+        return [list.__getitem__(self, part) for part in chunk_slices(len(self), workers)]
+
+    def mean(self, workers=None):
         """
         Calculate the arithmetic mean of the list elements.
 
+        Args:
+            workers: Number of processes to split the sum across. Lists shorter
+                than PARALLEL_THRESHOLD are always summed in this process.
+
         Returns:
             float: The mean value of all elements
 
@@ -144,36 +478,127 @@ class SmartList(list):
         """
         if not self:
             raise ValueError("Cannot calculate mean of empty list")
-        return sum(self) / len(self)
+        stats = self._statistics()
+        if stats.total is None:
+            if use_parallel(len(self), workers):
+                partials = map_chunks(sum_chunk, self._chunks(workers), workers)
+                stats.total = sum(total for total, _ in partials)
+            else:
+                stats.total = sum(self)
+        return stats.total / len(self)
 
     def median(self):
         """
         Calculate the median value of the list elements.
 
         For lists with an even number of elements, returns the average of the two middle values.
+        Uses quickselect, so it runs in expected O(n) time instead of sorting the list.
+        Repeated calls switch to a cached sorted index and run in O(1).
 
         Returns:
             float or numeric: The median value
 
+        Raises:
+            ValueError: If the list is empty
+
         Example:
             >>> SmartList([1, 3, 5, 7]).median()
             4.0
             >>> SmartList([1, 3, 5]).median()
             3
         """
-        sorted_list = sorted(self)
-        length = len(sorted_list)
+        if not self:
+            raise ValueError("Cannot calculate median of empty list")
+        length = len(self)
+        ordered = self._ordered_index()
         if length % 2 == 0:
-            return (sorted_list[length // 2 - 1] + sorted_list[length // 2]) / 2
+            if ordered is None:
+                low, high = multiselect(self, [length // 2 - 1, length // 2])
+            else:
+                low, high = ordered[length // 2 - 1], ordered[length // 2]
+            return (low + high) / 2
         else:
-            return sorted_list[length // 2]
+            if ordered is None:
+                return select(self, length // 2)
+            return ordered[length // 2]
 
-    def mode(self):
+    def quantile(self, q, approximate=False):
+        """
+        Calculate the q-th quantile of the list elements.
+
+        Values between two ranks are linearly interpolated, matching the default
+        method of numpy.quantile.
+
+        Args:
+            q: The quantile to compute, between 0 and 1
+            approximate: If True, estimate the quantile in one streaming pass with
+                the P-squared algorithm instead of copying the list
+
+        Returns:
+            float or numeric: The quantile value
+
+        Raises:
+            ValueError: If the list is empty or q is outside [0, 1]
+
+        Example:
+            >>> SmartList([1, 2, 3, 4, 5]).quantile(0.25)
+            2
+            >>> SmartList([1, 2, 3, 4]).quantile(0.5)
+            2.5
+        """
+        return self.quantiles([q], approximate)[0]
+
+    def quantiles(self, qs, approximate=False):
+        """
+        Calculate several quantiles with a single partitioning pass.
+
+        Args:
+            qs: An iterable of quantiles, each between 0 and 1
+            approximate: If True, estimate every quantile in one streaming pass
+                with constant memory per quantile
+
+        Returns:
+            list: The quantile values, in the order they were requested
+
+        Raises:
+            ValueError: If the list is empty or any q is outside [0, 1]
+
+        Example:
+            >>> SmartList(range(1, 101)).quantiles([0.25, 0.5, 0.75])
+            [25.75, 50.5, 75.25]
+        """
+        qs = list(qs)
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if not self:
+            raise ValueError("Cannot calculate quantile of empty list")
+
+        if approximate:
+            sketches = [P2Quantile(q) for q in qs]
+            for item in self:
+                for sketch in sketches:
+                    sketch.add(item)
+            return [sketch.value() for sketch in sketches]
+
+        length = len(self)
+        ordered = self._ordered_index()
+        if ordered is not None:
+            return [interpolate(q, length, ordered.__getitem__) for q in qs]
+        ranks = sorted({rank for q in qs for rank in quantile_ranks(q, length)})
+        by_rank = dict(zip(ranks, multiselect(self, ranks)))
+        return [interpolate(q, length, by_rank.__getitem__) for q in qs]
+
+    def mode(self, workers=None):
         """
         Return the most common element(s) in the list.
 
         If multiple elements appear with the same frequency, all are returned.
 
+        Args:
+            workers: Number of processes to build the element counts with. Lists
+                shorter than PARALLEL_THRESHOLD are always counted in this process.
+
         Returns:
             list: The most frequent element(s)
 
@@ -189,22 +614,49 @@ class SmartList(list):
         if not self:
             raise ValueError("Cannot calculate mode of empty list")
 
-        counter = Counter(self)
+        stats = self._statistics()
+        if stats.counter is None:
+            if use_parallel(len(self), workers):
+                stats.counter = Counter()
+                for partial in map_chunks(count_chunk, self._chunks(workers), workers):
+                    stats.counter.update(partial)
+            else:
+                stats.counter = Counter(self)
+        counter = stats.counter
         max_count = max(counter.values())
         return [item for item, count in counter.items() if count == max_count]
 
-    def where(self, predicate=None, operator=None, value=None):
+    def where(
+        self,
+        predicate=None,
+        operator=None,
+        value=None,
+        conditions=None,
+        combine="and",
+        workers=None,
+    ):
         """
         Filter list elements based on a predicate function or comparison.
 
-        This method supports two filtering approaches:
+        This method supports three filtering approaches:
         1. Using a predicate function that returns True/False for each element
         2. Using a comparison operator and value (e.g., ">", 5)
+        3. Using several (operator, value) conditions combined with "and" or "or"
+
+        Operators are resolved to functions from the operator module once per call,
+        and the filtering loop itself runs in C through filter().
 
         Args:
             predicate: A function that returns True/False for each element
-            operator: Comparison operator (">", "<", "==", "!=", ">=", "<=")
+            operator: Comparison operator (">", "<", "==", "!=", ">=", "<=", "between").
+                For "between", value is an inclusive (low, high) pair.
             value: Value to compare against
+            conditions: A list of (operator, value) pairs evaluated in a single pass
+            combine: "and" to keep elements matching every condition, "or" for any
+            workers: Number of processes to filter with, useful for expensive
+                predicates. The predicate must be picklable, so use a module-level
+                function rather than a lambda. Lists shorter than
+                PARALLEL_THRESHOLD are always filtered in this process.
 
         Returns:
             SmartList: A new SmartList containing only elements that match the filter
@@ -217,28 +669,74 @@ class SmartList(list):
             [2, 4]
             >>> SmartList([1, 2, 3, 4, 5]).where(operator=">", value=3)
             [4, 5]
+            >>> SmartList([1, 2, 3, 4, 5]).where(operator="between", value=(2, 4))
+            [2, 3, 4]
+            >>> SmartList([1, 2, 3, 4, 5]).where(conditions=[("<", 2), (">", 4)], combine="or")
+            [1, 5]
+        """
+        predicate, conditions, combine = parse_where(
+            predicate, operator, value, conditions, combine
+        )
+        if use_parallel(len(self), workers):
+            tasks = [
+                (predicate, conditions, combine, chunk) for chunk in self._chunks(workers)
+            ]
+            result = type(self)()
+            for part in map_chunks(filter_chunk, tasks, workers):
+                result.extend(part)
+            return result
+        if predicate is None:
+            predicate = compile_conditions(conditions, combine)
+        return type(self)(filter(predicate, self))
+
+    def group_by(self, key, value=None):
         """
-        match (predicate, operator, value):
-            case (callable, None, None):
-                return type(self)([item for item in self if predicate(item)])
-            case (None, str(), _):
-                return type(self)(
-                    [
-                        item
-                        for item in self
-                        if self._evaluate_condition(item, operator, value)
-                    ]
-                )
-            case _:
-                raise ValueError(
-                    "Invalid arguments. Provide either a predicate function or an operator and value."
-                )
+        Group the elements by a key for single-pass aggregation.
+
+        Args:
+            key: A function computing each element's group, or a key/index to
+                look up on each element (e.g. a dict key)
+            value: Optional function, or key/index, selecting the value to
+                aggregate. Defaults to the element itself.
+
+        Returns:
+            GroupBy: An object whose agg() method computes per-group results
+
+        Example:
+            >>> SmartList([1, 2, 3, 4, 5]).group_by(lambda x: x % 2).agg(n="count", total="sum")
+            {1: {'n': 3, 'total': 9}, 0: {'n': 2, 'total': 6}}
+        """
+        from .aggregation import GroupBy
+
+        return GroupBy(self, key, value)
+
+    def rolling(self, window):
+        """
+        Create fixed-size sliding windows over the list.
+
+        Args:
+            window: The number of consecutive elements in each window
+
+        Returns:
+            Rolling: An object with sum(), mean(), min() and max() methods
+
+        Raises:
+            ValueError: If window is not a positive integer
+
+        Example:
+            >>> SmartList([1, 2, 3, 4, 5]).rolling(2).mean()
+            [1.5, 2.5, 3.5, 4.5]
+        """
+        from .aggregation import Rolling
+
+        return Rolling(self, window)
 
     def _evaluate_condition(self, item, operator, value):
         """
         Evaluate a condition based on operator and value.
 
-        Internal helper method used by the where() method to evaluate comparison conditions.
+        Internal helper kept for callers that test a single item; where() compiles
+        its conditions once instead of calling this per element.
 
         Args:
             item: The item to compare
@@ -251,18 +749,6 @@ class SmartList(list):
         Raises:
             ValueError: If an unsupported operator is provided
         """
-        match operator:
-            case "==":
-                return item == value
-            case "!=":
-                return item != value
-            case ">":
-                return item > value
-            case "<":
-                return item < value
-            case ">=":
-                return item >= value
-            case "<=":
-                return item <= value
-            case _:
-                raise ValueError(f"Unsupported operator: {operator}")
+        if operator not in COMPARISONS:
+            raise ValueError(f"Unsupported operator: {operator}")
+        return COMPARISONS[operator](item, value)
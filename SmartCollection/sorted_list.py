@@ -0,0 +1,329 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, chain, groupby, islice
+
+from .predicates import compile_conditions, parse_where
+from .selection import interpolate
+from .smart_list import SmartList
+from .stats_cache import update_total
+
+
+class SortedSmartList:
+    """
+    A list that keeps its elements sorted as they are added.
+
+    Elements are stored in a list of sorted sublists of roughly LOAD elements,
+    the layout used by the sortedcontainers package, plus the maximum of each
+    sublist. Adding or removing an element bisects the maxima and then one
+    sublist, so it moves at most a few thousand pointers instead of shifting the
+    whole list. Positional lookups use cumulative sublist offsets that are
+    rebuilt lazily after a mutation.
+
+    Range filters, rank and k-th element queries, and median() therefore run in
+    O(log n), plus the size of the result for filters.
+
+    Examples:
+        >>> scores = SortedSmartList([40, 10, 30, 20])
+        >>> scores.add(25)
+        >>> scores
+        SortedSmartList([10, 20, 25, 30, 40])
+        >>> scores.where(operator=">=", value=25)
+        [25, 30, 40]
+        >>> scores.median(), scores.rank(30), scores[1]
+        (25, 3, 20)
+    """
+
+    LOAD = 1000
+
+    def __init__(self, iterable=()):
+        self._lists = []
+        self._maxes = []
+        self._offsets = None
+        self._len = 0
+        self._total = 0
+        self.update(iterable)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return chain.from_iterable(reversed(part) for part in reversed(self._lists))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __contains__(self, value):
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        part = self._lists[pos]
+        index = bisect_left(part, value)
+        return part[index] == value
+
+    def add(self, value):
+        """Insert value, keeping the list sorted."""
+        if not self._maxes:
+            self._lists.append([value])
+            self._maxes.append(value)
+        else:
+            pos = bisect_right(self._maxes, value)
+            if pos == len(self._maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                insort(self._lists[pos], value)
+            self._split(pos)
+        self._len += 1
+        self._offsets = None
+        if self._total is not None:
+            self._total = update_total(self._total, value)
+
+    def update(self, iterable):
+        """Add every value from iterable, re-sorting once for large batches."""
+        values = list(iterable)
+        if len(values) * 4 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        values = sorted(chain(self, values))
+        load = self.LOAD
+        self._lists = [values[start : start + load] for start in range(0, len(values), load)]
+        self._maxes = [part[-1] for part in self._lists]
+        self._len = len(values)
+        self._offsets = None
+        try:
+            self._total = sum(values)
+        except TypeError:
+            self._total = None
+
+    def remove(self, value):
+        """
+        Remove one occurrence of value.
+
+        Raises:
+            ValueError: If value is not present
+        """
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in list")
+
+    def discard(self, value):
+        """Remove one occurrence of value if present. Returns True if it was removed."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        part = self._lists[pos]
+        index = bisect_left(part, value)
+        if part[index] != value:
+            return False
+        self._delete(pos, index)
+        return True
+
+    def pop(self, index=-1):
+        """Remove and return the element at index (the largest by default)."""
+        if not self._len:
+            raise IndexError("pop from empty list")
+        pos, offset = self._locate(index)
+        value = self._lists[pos][offset]
+        self._delete(pos, offset)
+        return value
+
+    def clear(self):
+        self._lists = []
+        self._maxes = []
+        self._offsets = None
+        self._len = 0
+        self._total = 0
+
+    def _split(self, pos):
+        part = self._lists[pos]
+        if len(part) > 2 * self.LOAD:
+            half = part[self.LOAD :]
+            del part[self.LOAD :]
+            self._lists.insert(pos + 1, half)
+            self._maxes[pos] = part[-1]
+            self._maxes.insert(pos + 1, half[-1])
+
+    def _delete(self, pos, index):
+        part = self._lists[pos]
+        value = part.pop(index)
+        if part:
+            self._maxes[pos] = part[-1]
+        else:
+            del self._lists[pos]
+            del self._maxes[pos]
+        self._len -= 1
+        self._offsets = None
+        if self._total is not None:
+            self._total = update_total(self._total, value, removed=True)
+
+    def _locate(self, index):
+        """Translate a list index into (sublist position, offset within it)."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        offsets = self._cumulative_offsets()
+        pos = bisect_right(offsets, index) - 1
+        return pos, index - offsets[pos]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SmartList(list(self)[index])
+        pos, offset = self._locate(index)
+        return self._lists[pos][offset]
+
+    def __delitem__(self, index):
+        pos, offset = self._locate(index)
+        self._delete(pos, offset)
+
+    def bisect_left(self, value):
+        """Return the index where value would be inserted before any equal elements."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._start(pos) + bisect_left(self._lists[pos], value)
+
+    def bisect_right(self, value):
+        """Return the index where value would be inserted after any equal elements."""
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._start(pos) + bisect_right(self._lists[pos], value)
+
+    def _cumulative_offsets(self):
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(len(part) for part in self._lists)]
+        return self._offsets
+
+    def _start(self, pos):
+        return self._cumulative_offsets()[pos]
+
+    def rank(self, value):
+        """Return the number of elements strictly smaller than value."""
+        return self.bisect_left(value)
+
+    def kth(self, k):
+        """Return the k-th smallest element (0-based)."""
+        return self[k]
+
+    def islice(self, start, stop):
+        """Iterate over the elements at positions start to stop without copying."""
+        if start >= stop:
+            return iter(())
+        pos, offset = self._locate(start)
+        first = islice(self._lists[pos], offset, None)
+        rest = chain.from_iterable(islice(self._lists, pos + 1, None))
+        return islice(chain(first, rest), stop - start)
+
+    def _range(self, operator, value):
+        """Return the (start, stop) index range of elements satisfying one condition."""
+        match operator:
+            case ">":
+                return self.bisect_right(value), self._len
+            case ">=":
+                return self.bisect_left(value), self._len
+            case "<":
+                return 0, self.bisect_left(value)
+            case "<=":
+                return 0, self.bisect_right(value)
+            case "==":
+                return self.bisect_left(value), self.bisect_right(value)
+            case "between":
+                low, high = value
+                return self.bisect_left(low), self.bisect_right(high)
+        return None
+
+    def where(
+        self, predicate=None, operator=None, value=None, conditions=None, combine="and"
+    ):
+        """
+        Filter elements like SmartList.where(), using bisection where possible.
+
+        Comparison conditions other than "!=" combined with "and" are each turned
+        into an index range by bisection and intersected, so only the matching
+        elements are visited. Predicates, "!=" and "or" fall back to a scan.
+
+        Returns:
+            SmartList: The matching elements, in sorted order
+
+        Raises:
+            ValueError: If invalid arguments are provided
+        """
+        predicate, conditions, combine = parse_where(
+            predicate, operator, value, conditions, combine
+        )
+        if predicate is None and (combine == "and" or len(conditions) == 1):
+            ranges = [self._range(operator, value) for operator, value in conditions]
+            if None not in ranges:
+                start = max(start for start, _ in ranges)
+                stop = min(stop for _, stop in ranges)
+                return SmartList(self.islice(start, stop))
+        if predicate is None:
+            predicate = compile_conditions(conditions, combine)
+        return SmartList(filter(predicate, self))
+
+    def mean(self):
+        """
+        Return the arithmetic mean, from a running total kept on every insert and removal.
+
+        The total is only kept incrementally while the values are ints or
+        Fractions. Otherwise it is summed again after each change, since
+        removing a large float from a float total loses the smaller values.
+
+        Raises:
+            ValueError: If the list is empty
+        """
+        if not self._len:
+            raise ValueError("Cannot calculate mean of empty list")
+        if self._total is None:
+            self._total = sum(self)
+        return self._total / self._len
+
+    def median(self):
+        """
+        Return the median in O(log n) using positional lookups.
+
+        Raises:
+            ValueError: If the list is empty
+        """
+        if not self._len:
+            raise ValueError("Cannot calculate median of empty list")
+        middle = self._len // 2
+        if self._len % 2 == 0:
+            return (self[middle - 1] + self[middle]) / 2
+        return self[middle]
+
+    def quantile(self, q):
+        """Return the q-th quantile with linear interpolation, like SmartList.quantile()."""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs):
+        """Return several quantiles, each found with a positional lookup."""
+        qs = list(qs)
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if not self._len:
+            raise ValueError("Cannot calculate quantile of empty list")
+        return [interpolate(q, self._len, self.__getitem__) for q in qs]
+
+    def mode(self):
+        """
+        Return the most common element(s), in ascending order.
+
+        Equal elements are adjacent, so this counts runs without hashing.
+
+        Raises:
+            ValueError: If the list is empty
+        """
+        if not self._len:
+            raise ValueError("Cannot calculate mode of empty list")
+        runs = [(item, sum(1 for _ in group)) for item, group in groupby(self)]
+        max_count = max(count for _, count in runs)
+        return [item for item, count in runs if count == max_count]
@@ -0,0 +1,76 @@
+from bisect import bisect_left, insort
+from fractions import Fraction
+
+
+# Sums of these types are exact, so a running total can follow additions and
+# removals. A float total cannot: after 1e16 + 1.0 - 1e16 the 1.0 is gone.
+EXACT_TYPES = (int, Fraction)
+
+
+def update_total(total, item, removed=False):
+    """
+    Return total with item added (or removed), or None if the total has to be
+    recomputed because either of them is not an exact number.
+    """
+    if not (isinstance(total, EXACT_TYPES) and isinstance(item, EXACT_TYPES)):
+        return None
+    return total - item if removed else total + item
+
+
+class StatsCache:
+    """
+    Running aggregates kept by a SmartList between mutations.
+
+    Each aggregate is built the first time a statistic needs it and is then
+    updated incrementally as items are added or removed. The running sum is
+    only kept while every item is an int or Fraction; any other item drops it
+    and it is summed afresh, since removing floats from a float sum cancels
+    away the precision of the items that remain. If an update fails,
+    for example because an appended item is not numeric, not hashable, or not
+    comparable with the rest, only that aggregate is dropped and it will be
+    rebuilt from scratch on the next call.
+
+    Attributes:
+        total: Running sum of the items, used by mean()
+        counter: Counter of the items, used by mode()
+        ordered: Sorted copy of the items, used by median() and quantiles()
+        order_queries: Number of order statistics answered without the sorted index
+    """
+
+    def __init__(self):
+        self.total = None
+        self.counter = None
+        self.ordered = None
+        self.order_queries = 0
+
+    def add(self, item):
+        if self.total is not None:
+            self.total = update_total(self.total, item)
+        if self.counter is not None:
+            try:
+                self.counter[item] += 1
+            except TypeError:
+                self.counter = None
+        if self.ordered is not None:
+            try:
+                insort(self.ordered, item)
+            except TypeError:
+                self.ordered = None
+
+    def discard(self, item):
+        if self.total is not None:
+            self.total = update_total(self.total, item, removed=True)
+        if self.counter is not None:
+            self.counter[item] -= 1
+            if not self.counter[item]:
+                del self.counter[item]
+        if self.ordered is not None:
+            del self.ordered[bisect_left(self.ordered, item)]
+
+    def add_many(self, items):
+        for item in items:
+            self.add(item)
+
+    def discard_many(self, items):
+        for item in items:
+            self.discard(item)
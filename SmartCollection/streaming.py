@@ -0,0 +1,212 @@
+import codecs
+import json
+import re
+
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+_STRING_END = re.compile(r'["\\]')
+_CONTAINER_TOKEN = re.compile(r'["{}\[\]]')
+_SCALAR_END = re.compile(r"[,\]}\s]")
+
+
+def path_tree(paths, separator="."):
+    """
+    Merge dotted paths into a tree of keys.
+
+    Each node maps a key to its child node, or to None when the whole value
+    under that key was requested. A path that is a prefix of another one wins.
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        *parents, last = path.split(separator)
+        for key in parents:
+            child = node.setdefault(key, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[last] = None
+    return tree
+
+
+class _Scanner:
+    """
+    Reads JSON text from a file in chunks, without building skipped values.
+
+    Only the unread part of the current chunk is kept, except while a value is
+    being captured, when the buffer holds that value's text and nothing else.
+    """
+
+    def __init__(self, fp, chunk_size):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = None
+        self._buffer = ""
+        self._pos = 0
+        self._mark = None
+
+    def _read_chunk(self):
+        while True:
+            chunk = self._fp.read(self._chunk_size)
+            if not isinstance(chunk, bytes):
+                return chunk
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder("utf-8")()
+            text = self._decoder.decode(chunk, final=not chunk)
+            # A chunk can end inside a multi-byte character and decode to nothing.
+            if text or not chunk:
+                return text
+
+    def _fill(self):
+        """Append the next chunk to the buffer. Returns False at end of file."""
+        chunk = self._read_chunk()
+        if not chunk:
+            return False
+        cut = self._pos if self._mark is None else self._mark
+        self._buffer = self._buffer[cut:] + chunk
+        self._pos -= cut
+        if self._mark is not None:
+            self._mark -= cut
+        return True
+
+    def _error(self, message):
+        return ValueError(f"Invalid JSON: {message}")
+
+    def peek(self):
+        """Skip whitespace and return the next character, or "" at end of file."""
+        while True:
+            buffer = self._buffer
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(buffer):
+                return buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, character):
+        if self.peek() != character:
+            raise self._error(f"expected {character!r} at {self.peek()!r}")
+        self._pos += 1
+
+    def _search(self, pattern):
+        """Move to the next match of pattern, reading more chunks as needed."""
+        while True:
+            match = pattern.search(self._buffer, self._pos)
+            if match:
+                self._pos = match.start()
+                return self._buffer[self._pos]
+            self._pos = len(self._buffer)
+            if not self._fill():
+                raise self._error("unexpected end of file")
+
+    def _skip_string(self):
+        self._pos += 1
+        while True:
+            if self._search(_STRING_END) == '"':
+                self._pos += 1
+                return
+            self._pos += 1
+            if self._pos >= len(self._buffer) and not self._fill():
+                raise self._error("unexpected end of file")
+            self._pos += 1
+
+    def _skip_value(self):
+        first = self.peek()
+        if first == '"':
+            self._skip_string()
+        elif first in "{[":
+            depth = 0
+            while True:
+                token = self._search(_CONTAINER_TOKEN)
+                if token == '"':
+                    self._skip_string()
+                    continue
+                self._pos += 1
+                depth += 1 if token in "{[" else -1
+                if not depth:
+                    return
+        elif first:
+            while True:
+                match = _SCALAR_END.search(self._buffer, self._pos)
+                if match:
+                    self._pos = match.start()
+                    return
+                self._pos = len(self._buffer)
+                if not self._fill():
+                    return
+        else:
+            raise self._error("unexpected end of file")
+
+    def skip(self):
+        """Skip over the next value without decoding it."""
+        self._skip_value()
+
+    def capture(self):
+        """Decode the next value."""
+        self.peek()
+        self._mark = self._pos
+        try:
+            self._skip_value()
+            text = self._buffer[self._mark : self._pos]
+        finally:
+            self._mark = None
+        return json.loads(text)
+
+    def key(self):
+        """Decode an object key and consume the colon after it."""
+        if self.peek() != '"':
+            raise self._error(f"expected an object key at {self.peek()!r}")
+        key = self.capture()
+        self.expect(":")
+        return key
+
+    def select(self, tree):
+        """Build a dict from the object at the current position, keeping only tree's keys."""
+        self.expect("{")
+        result = {}
+        if self.peek() == "}":
+            self._pos += 1
+            return result
+        while True:
+            key = self.key()
+            if key not in tree:
+                self.skip()
+            elif tree[key] is None:
+                result[key] = self.capture()
+            elif self.peek() == "{":
+                selected = self.select(tree[key])
+                # An object holding none of the requested paths is left out too.
+                if selected:
+                    result[key] = selected
+            else:
+                # The path continues below a value that is not an object.
+                self.skip()
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return result
+            if separator != ",":
+                raise self._error(f"expected ',' or '}}' at {separator!r}")
+
+
+def load_paths(fp, paths, separator=".", chunk_size=CHUNK_SIZE):
+    """
+    Read the values at the given dotted paths from a JSON object in a file.
+
+    Returns:
+        dict: The requested values, nested under their paths. Missing paths
+        are left out.
+
+    Raises:
+        ValueError: If the document is not valid JSON or its root is not an object
+    """
+    scanner = _Scanner(fp, chunk_size)
+    if scanner.peek() != "{":
+        raise ValueError("from_json_stream() needs a JSON object at the root")
+    result = scanner.select(path_tree(paths, separator))
+    if scanner.peek():
+        raise ValueError("Invalid JSON: extra data after the root object")
+    return result
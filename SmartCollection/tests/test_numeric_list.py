@@ -0,0 +1,14 @@
+import pytest
+
+from SmartCollection import SmartList
+
+pytest.importorskip("numpy")
+
+
+def test_from_numeric_rejects_integers_that_float64_would_round():
+    with pytest.raises(ValueError):
+        SmartList.from_numeric([2**53 + 1])
+
+
+def test_from_numeric_accepts_integers_that_float64_holds_exactly():
+    assert SmartList.from_numeric([2**53, 1]) == [2.0**53, 1.0]
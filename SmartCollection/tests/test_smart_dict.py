@@ -0,0 +1,72 @@
+import io
+import json
+from collections import OrderedDict
+
+import pytest
+
+from SmartCollection import SmartDict
+
+
+def test_nested_dicts_are_smart_dicts_from_the_start():
+    inner = {"host": "localhost"}
+    config = SmartDict({"db": inner})
+    stored = config["db"]
+
+    assert isinstance(stored, SmartDict)
+    assert config.db is stored
+    assert config["db"] is stored
+    assert json.dumps(config.db) == '{"host": "localhost"}'
+    assert config.db | {"port": 1} == {"host": "localhost", "port": 1}
+
+
+def test_attribute_access_does_not_replace_values():
+    ordered = OrderedDict(a=1)
+    config = SmartDict(ordered=ordered)
+
+    assert config.ordered is ordered
+    assert config["ordered"] is ordered
+
+
+def test_writes_through_attribute_chains_reach_the_document():
+    config = SmartDict()
+    config.db = {"host": "localhost"}
+
+    config.db.port = 5432
+
+    assert config["db"] == {"host": "localhost", "port": 5432}
+
+
+def test_from_json_stream_leaves_out_missing_paths():
+    document = '{"meta": {"version": 3}, "rows": []}'
+
+    for path in ["meta.owner", "meta.version.deep"]:
+        loaded = SmartDict.from_json_stream(io.StringIO(document), paths=[path])
+
+        assert loaded == {}
+
+    loaded = SmartDict.from_json_stream(
+        io.StringIO(document), paths=["meta.owner", "meta.version"]
+    )
+    assert loaded == {"meta": {"version": 3}}
+
+
+def test_transform_keeps_list_items_under_keys_included_by_name():
+    data = SmartDict({"a": [1, 2], "b": 3, "q": {"r": 4, "s": 5}})
+
+    result = data.transform(lambda value: value * 10, include_keys=["a", "q.r"])
+
+    assert result == {"a": [10, 20], "b": 3, "q": {"r": 40, "s": 5}}
+
+
+def test_diff_rejects_keys_that_apply_could_not_address():
+    with pytest.raises(TypeError):
+        SmartDict({1: "x"}).diff({1: "y"})
+
+
+def test_diff_round_trips_through_apply():
+    old = SmartDict({"a/b": {"~c": 1}, "items": [{"x": 1}]})
+    new = {"a/b": {"~c": 2}, "items": [{"x": 2}, 3]}
+
+    old.apply(old.diff(new))
+
+    assert old == new
@@ -0,0 +1,58 @@
+import copy
+import pickle
+
+from SmartCollection import SmartList
+
+
+def test_copy_does_not_share_statistics_cache():
+    nums = SmartList([1, 2, 3])
+    assert nums.mean() == 2.0
+
+    duplicate = copy.copy(nums)
+
+    assert nums.mean() == 2.0
+    assert duplicate.mean() == 2.0
+    duplicate.append(10)
+    assert nums.mean() == 2.0
+    assert duplicate.mean() == 4.0
+
+
+def test_deepcopy_recomputes_statistics():
+    nums = SmartList([1, 2, 3])
+    nums.mean()
+    nums.mode()
+
+    duplicate = copy.deepcopy(nums)
+
+    assert duplicate.mean() == 2.0
+    assert duplicate.mode() == [1, 2, 3]
+    assert nums.mean() == 2.0
+
+
+def test_pickle_round_trip_drops_statistics_cache():
+    nums = SmartList([1, 2, 3])
+    nums.mean()
+
+    restored = pickle.loads(pickle.dumps(nums))
+
+    assert "_stats" not in restored.__dict__
+    assert restored == [1, 2, 3]
+    assert restored.mean() == 2.0
+
+
+def test_mean_after_removing_a_large_float_keeps_precision():
+    nums = SmartList([1e16, 1.0])
+    nums.mean()
+
+    nums.pop(0)
+
+    assert nums.mean() == 1.0
+
+
+def test_mean_after_overwriting_a_large_float_keeps_precision():
+    nums = SmartList([1e16, 1.0])
+    nums.mean()
+
+    nums[0] = 0.0
+
+    assert nums.mean() == 0.5
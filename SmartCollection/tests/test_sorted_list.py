@@ -0,0 +1,19 @@
+from SmartCollection import SortedSmartList
+
+
+def test_mean_after_removing_a_large_float_keeps_precision():
+    values = SortedSmartList([1e16, 1.0])
+    values.mean()
+
+    values.remove(1e16)
+
+    assert values.mean() == 1.0
+
+
+def test_mean_follows_integer_inserts_and_removals():
+    values = SortedSmartList([1, 2, 3])
+
+    values.add(6)
+    values.remove(1)
+
+    assert values.mean() == 11 / 3
@@ -0,0 +1,118 @@
+from collections.abc import Sequence
+from itertools import islice
+
+from .parallel import chunk_slices
+from .predicates import compile_conditions, parse_where
+from .smart_list import SmartList
+from .stats_cache import StatsCache
+
+
+class SmartListView(Sequence):
+    """
+    A zero-copy window onto a slice of a SmartList.
+
+    The view stores only the parent list and a range of indices, so creating one
+    costs O(1) regardless of the window size. Reads and writes go straight to
+    the parent. mean() and mode() stream over the window; median() and the
+    quantiles copy it once, since selection has to reorder the values.
+
+    The window's indices are fixed when the view is created: resizing the
+    parent afterwards does not move the window, and using a view whose window
+    runs past the end of a parent that has shrunk raises IndexError.
+
+    Examples:
+        >>> nums = SmartList([1, 2, 3, 4, 5, 6])
+        >>> window = nums.view(slice(1, 5))
+        >>> window.mean()
+        3.5
+        >>> window[0] = 20
+        >>> nums
+        [1, 20, 3, 4, 5, 6]
+    """
+
+    def __init__(self, parent, indices):
+        self._parent = parent
+        self._indices = indices
+
+    def __len__(self):
+        return len(self._indices)
+
+    def _check_bounds(self):
+        indices = self._indices
+        if indices and max(indices[0], indices[-1]) >= len(self._parent):
+            raise IndexError(
+                f"view {indices} extends past the end of its parent list, "
+                f"which now has {len(self._parent)} elements"
+            )
+
+    def __iter__(self):
+        self._check_bounds()
+        indices, parent = self._indices, self._parent
+        if indices.step > 0:
+            return islice(list.__iter__(parent), indices.start, indices.stop, indices.step)
+        last = len(parent) - 1
+        return islice(
+            list.__reversed__(parent),
+            last - indices.start,
+            last - indices.stop,
+            -indices.step,
+        )
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return SmartList(map(self._parent.__getitem__, self._indices[key]))
+        return self._parent[self._indices[key]]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            indices = self._indices[key]
+            value = list(value)
+            if len(value) != len(indices):
+                raise ValueError(
+                    f"attempt to assign sequence of size {len(value)} to view slice of size {len(indices)}"
+                )
+            for index, item in zip(indices, value):
+                self._parent[index] = item
+        else:
+            self._parent[self._indices[key]] = value
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def view(self, key):
+        """Return a view onto a slice of this view, sharing the same parent."""
+        return type(self)(self._parent, self._indices[key])
+
+    def tolist(self):
+        """Copy the window into a new SmartList."""
+        return SmartList(self)
+
+    def _statistics(self):
+        # The parent can change under the view, so nothing is cached between calls.
+        return StatsCache()
+
+    def _ordered_index(self):
+        return None
+
+    def _chunks(self, workers):
+        return [self[part] for part in chunk_slices(len(self), workers)]
+
+    mean = SmartList.mean
+    median = SmartList.median
+    quantile = SmartList.quantile
+    quantiles = SmartList.quantiles
+    mode = SmartList.mode
+
+    def where(
+        self, predicate=None, operator=None, value=None, conditions=None, combine="and"
+    ):
+        """Filter the window like SmartList.where(), returning a new SmartList."""
+        predicate, conditions, combine = parse_where(
+            predicate, operator, value, conditions, combine
+        )
+        if predicate is None:
+            predicate = compile_conditions(conditions, combine)
+        return SmartList(filter(predicate, self))
@@ -0,0 +1,162 @@
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # redis is optional; without it the in-process cache is used
+    redis = None
+
+
+def new_version() -> bytes:
+    # Random rather than counted: a version that expired and is set again must
+    # never come back to a value that cached entries are still stored under.
+    return uuid.uuid4().hex.encode()
+
+
+class LRUCache:
+    """
+    In-process cache holding at most maxsize entries, each for ttl seconds.
+
+    Version keys (see bump()) are kept apart from the entries, so eviction can
+    never drop one early. Each lasts version_ttl seconds after its last bump,
+    so at most one is held per key bumped within that time.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60, version_ttl: float = 660):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.version_ttl = version_ttl
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._prune_at = maxsize
+
+    async def get(self, key: str) -> Optional[bytes]:
+        version = self._versions.get(key)
+        if version is not None:
+            expires, value = version
+            if expires >= time.monotonic():
+                return value
+            del self._versions[key]
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    async def bump(self, key: str):
+        now = time.monotonic()
+        self._versions[key] = (now + self.version_ttl, new_version())
+        if len(self._versions) > self._prune_at:
+            self._versions = {
+                key: version for key, version in self._versions.items() if version[0] >= now
+            }
+            self._prune_at = max(2 * len(self._versions), self.maxsize)
+
+
+class RedisCache:
+    """Cache stored in Redis (or any server speaking its protocol), shared by all workers."""
+
+    def __init__(self, url: str, ttl: float = 60, version_ttl: float = 660):
+        if redis is None:
+            raise RuntimeError("CACHE_URL points to Redis, but the redis package is not installed")
+        self.ttl = ttl
+        self.version_ttl = version_ttl
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes):
+        await self._client.set(key, value, ex=max(int(self.ttl), 1))
+
+    async def delete(self, key: str):
+        await self._client.delete(key)
+
+    async def bump(self, key: str):
+        await self._client.set(key, new_version(), ex=max(int(self.version_ttl), 1))
+
+
+def build_cache():
+    """
+    Create the cache configured by the environment:
+
+    CACHE_URL          redis://... to use Redis; unset for the in-process LRU
+    CACHE_TTL          seconds an entry stays valid (default 60)
+    CACHE_MAX_ENTRIES  size of the in-process LRU (default 1024)
+    CACHE_VERSION_TTL  seconds a version key outlives its last bump (default
+                       CACHE_TTL + 600). It must exceed CACHE_TTL plus the
+                       longest request: a version can only be forgotten once
+                       every entry stored under it has expired.
+    """
+    ttl = float(os.getenv("CACHE_TTL", "60"))
+    version_ttl = float(os.getenv("CACHE_VERSION_TTL", str(ttl + 600)))
+    url = os.getenv("CACHE_URL")
+    if url:
+        return RedisCache(url, ttl, version_ttl)
+    return LRUCache(int(os.getenv("CACHE_MAX_ENTRIES", "1024")), ttl, version_ttl)
+
+
+cache = build_cache()
+
+
+LIST_VERSION_KEY = "posts:list:version"
+
+
+async def current_version(version_key: str) -> str:
+    version = await cache.get(version_key)
+    return version.decode() if isinstance(version, bytes) else "0"
+
+
+def post_version_key(post_id: int) -> str:
+    return f"post:{post_id}:version"
+
+
+async def post_key(post_id: int) -> str:
+    """
+    Key for one cached post, under a version that every write to the post
+    replaces. Readers must build the key before querying the database: a
+    body read just before a concurrent write is then stored under the old
+    version, where no later read looks, instead of overwriting the fresh one.
+    """
+    return f"post:{post_id}:v{await current_version(post_version_key(post_id))}"
+
+
+async def list_key(*params) -> str:
+    """
+    Key for one page of a post listing. Pages are keyed under a version that
+    every write replaces, which invalidates all cached pages at once without
+    having to find them.
+    """
+    version = await current_version(LIST_VERSION_KEY)
+    return f"posts:list:{version}:" + ":".join(str(param) for param in params)
+
+
+async def invalidate_posts(post_ids):
+    """Retire the cached copies of several posts and every cached list page."""
+    for post_id in post_ids:
+        await cache.bump(post_version_key(post_id))
+    await cache.bump(LIST_VERSION_KEY)
+
+
+async def invalidate_post(post_id: Optional[int] = None):
+    """Retire the cached copy of one post (if given) and every cached list page."""
+    if post_id is not None:
+        await cache.bump(post_version_key(post_id))
+    await cache.bump(LIST_VERSION_KEY)
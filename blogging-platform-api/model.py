@@ -1,6 +1,6 @@
 from database import Base
 from sqlalchemy.sql import func
-from sqlalchemy import (Column, Integer, String, DateTime, JSON,)
+from sqlalchemy import (Column, Integer, String, DateTime, JSON, event,)
 
 class Post(Base):
     __tablename__ = "posts"
@@ -12,3 +12,49 @@ class Post(Base):
     tags = Column(JSON, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+# Full-text index over posts for /posts/search (SQLite only). posts_fts is an
+# external-content FTS5 table: it stores only the index and reads the text from
+# posts, and the triggers keep it in sync with every insert, update and delete.
+POSTS_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        title, content, category, content='posts', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_insert AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, title, content, category)
+        VALUES (new.id, new.title, new.content, new.category);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_delete AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content, category)
+        VALUES ('delete', old.id, old.title, old.content, old.category);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_update AFTER UPDATE OF title, content, category ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, content, category)
+        VALUES ('delete', old.id, old.title, old.content, old.category);
+        INSERT INTO posts_fts(rowid, title, content, category)
+        VALUES (new.id, new.title, new.content, new.category);
+    END
+    """,
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_posts_fts(target, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+    ).first()
+    for statement in POSTS_FTS_DDL:
+        connection.exec_driver_sql(statement)
+    if not exists:
+        # Index the posts written before the search table existed.
+        connection.exec_driver_sql("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
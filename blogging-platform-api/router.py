@@ -1,10 +1,19 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import JSONResponse
+import hashlib
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 
-from service import PostManager
-from schema import PostCreate, PostInDB, PostUpdate
+from service import PostManager, decode_cursor
+from schema import (
+    BulkResult,
+    PostBulkDelete,
+    PostBulkUpdate,
+    PostCreate,
+    PostInDB,
+    PostUpdate,
+)
 from database import get_db
 
 router = APIRouter(
@@ -15,13 +24,61 @@ router = APIRouter(
 db_dependency = Annotated[AsyncSession, Depends(get_db)]
 
 
+def cached_json_response(request: Request, body: bytes) -> Response:
+    """
+    Send serialized JSON with a strong ETag, or an empty 304 if the client's
+    If-None-Match already names that version.
+    """
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.post("/", response_model=PostInDB)
 async def create_post(
     session: db_dependency,
     post: PostCreate,
 ):
     try:
-        return await PostManager.create_post(post, session)
+        return await PostManager.create_post(session, post)
+    except Exception as e:
+        raise e
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def create_posts_bulk(
+    session: db_dependency,
+    posts: List[PostCreate],
+):
+    try:
+        return await PostManager.create_posts(session, posts)
+    except Exception as e:
+        raise e
+
+
+@router.patch("/bulk", response_model=BulkResult)
+async def update_posts_bulk(
+    session: db_dependency,
+    updates: List[PostBulkUpdate],
+):
+    try:
+        return await PostManager.update_posts(session, updates)
+    except Exception as e:
+        raise e
+
+
+@router.delete("/bulk", response_model=BulkResult)
+async def delete_posts_bulk(
+    session: db_dependency,
+    delete_form: PostBulkDelete,
+):
+    try:
+        return await PostManager.delete_posts(session, delete_form.ids)
     except Exception as e:
         raise e
 
@@ -51,30 +108,46 @@ async def delete_post(
 
 @router.get("/all", response_model=dict)
 async def get_all_posts_or_none(
+    request: Request,
     session: db_dependency,
-    skip: int = 0,
-    limit: int = 10,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    after_id: Optional[int] = Query(None, ge=0),
+    include_total: bool = False,
 ):
     try:
-        return await PostManager.get_all_posts_or_none(session, skip, limit)
+        if cursor is not None:
+            after_id = decode_cursor(cursor)
+        body = await PostManager.get_posts_page_json(
+            session, skip, limit, after_id, include_total
+        )
+        return cached_json_response(request, body)
     except Exception as e:
         raise e
 
 
 @router.get("/search", response_model=List[PostInDB])
-async def search_posts(session: db_dependency, search_term: str):
+async def search_posts(
+    session: db_dependency,
+    search_term: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1, le=100),
+):
     try:
-        return await PostManager.search_posts(session, search_term)
+        return await PostManager.search_posts(session, search_term, skip, limit)
     except Exception as e:
         raise e
 
 
 @router.get("/{post_id}", response_model=PostInDB)
 async def get_post(
+    request: Request,
     session: db_dependency,
     post_id: int,
 ):
     try:
-        return await PostManager.get_post(session, post_id)
+        body = await PostManager.get_post_json(session, post_id)
+        return cached_json_response(request, body)
     except Exception as e:
         raise e
@@ -1,12 +1,142 @@
+import base64
+import binascii
+import json
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, or_
+from sqlalchemy import delete, func, insert, or_, text, update
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Annotated
+from typing import Annotated, List, Optional
+
+from fastapi.encoders import jsonable_encoder
 
+from cache import cache, invalidate_post, invalidate_posts, list_key, post_key
 from model import Post
-from schema import PostCreate, PostInDB, PostUpdate
-from exceptions import InternalServerError, NotFound
+from schema import PostBulkUpdate, PostCreate, PostInDB, PostUpdate
+from exceptions import BadRequest, InternalServerError, NotFound
+
+
+def fts_query(search_term: str) -> str:
+    """
+    Turn free text into an FTS5 query that matches posts containing every word,
+    as a prefix. Each word is quoted, so punctuation and FTS5 operators in the
+    input are searched for literally instead of being parsed.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in search_term.split())
+
+
+# Bulk requests are written BULK_BATCH_SIZE items per transaction.
+BULK_BATCH_SIZE = 500
+BULK_MAX_ITEMS = 10_000
+
+
+async def run_bulk(
+    session: AsyncSession, items, apply_batch, item_id=lambda item: None, unique=False
+):
+    """
+    Apply apply_batch to items in batched transactions and report every item.
+
+    apply_batch(session, batch) receives a list of (index, item) pairs, issues
+    one executemany-style statement for them and returns an (id, error) pair per
+    item, with error None on success. If a batch fails as a whole, it is rolled
+    back and its items are retried one transaction each, so a single bad item
+    only fails itself. An item that fails on its own is reported with the id
+    item_id(item) returns, or None when the item has no id yet (a create).
+
+    With unique, an item whose id appeared earlier in the request is not
+    applied and fails as a duplicate, whether or not its batch is retried.
+    """
+    if len(items) > BULK_MAX_ITEMS:
+        raise BadRequest(f"A bulk request can contain at most {BULK_MAX_ITEMS} items")
+
+    results = []
+    indexed = list(enumerate(items))
+    if unique:
+        seen, first = set(), []
+        for index, item in indexed:
+            if item_id(item) in seen:
+                results.append(
+                    {"index": index, "id": item_id(item), "ok": False, "error": "Duplicate id"}
+                )
+            else:
+                seen.add(item_id(item))
+                first.append((index, item))
+        indexed = first
+    for start in range(0, len(indexed), BULK_BATCH_SIZE):
+        batch = indexed[start : start + BULK_BATCH_SIZE]
+        try:
+            outcomes = await apply_batch(session, batch)
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+            outcomes = []
+            for pair in batch:
+                try:
+                    outcomes.extend(await apply_batch(session, [pair]))
+                    await session.commit()
+                except SQLAlchemyError as e:
+                    await session.rollback()
+                    outcomes.append((item_id(pair[1]), str(getattr(e, "orig", None) or e)))
+        for (index, _), (post_id, error) in zip(batch, outcomes):
+            results.append({"index": index, "id": post_id, "ok": error is None, "error": error})
+    results.sort(key=lambda result: result["index"])
+
+    succeeded = [result["id"] for result in results if result["ok"]]
+    if succeeded:
+        await invalidate_posts(succeeded)
+    return {"succeeded": len(succeeded), "failed": len(results) - len(succeeded), "results": results}
+
+
+async def insert_batch(session: AsyncSession, batch):
+    result = await session.execute(
+        insert(Post).returning(Post.id, sort_by_parameter_order=True),
+        [post.model_dump() for _, post in batch],
+    )
+    return [(post_id, None) for post_id in result.scalars().all()]
+
+
+async def update_batch(session: AsyncSession, batch):
+    ids = [item.id for _, item in batch]
+    existing = set((await session.scalars(select(Post.id).where(Post.id.in_(ids)))).all())
+    rows, outcomes = [], []
+    for _, item in batch:
+        data = item.model_dump(exclude_unset=True, exclude={"id"})
+        if item.id not in existing:
+            outcomes.append((item.id, "Post not found"))
+        elif not data:
+            outcomes.append((item.id, "No fields to update"))
+        else:
+            rows.append({"id": item.id, **data})
+            outcomes.append((item.id, None))
+    if rows:
+        await session.execute(update(Post), rows)
+    return outcomes
+
+
+async def delete_batch(session: AsyncSession, batch):
+    ids = [post_id for _, post_id in batch]
+    deleted = set(
+        (await session.scalars(delete(Post).where(Post.id.in_(ids)).returning(Post.id))).all()
+    )
+    return [
+        (post_id, None if post_id in deleted else "Post not found") for post_id in ids
+    ]
+
+
+def encode_cursor(after_id: int) -> str:
+    payload = json.dumps({"after_id": after_id}).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after_id = json.loads(base64.urlsafe_b64decode(padded))["after_id"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise BadRequest("Invalid cursor")
+    if not isinstance(after_id, int) or after_id < 0:
+        raise BadRequest("Invalid cursor")
+    return after_id
 
 
 class PostManager:
@@ -23,6 +153,7 @@ class PostManager:
             session.add(new_post)
             await session.commit()
             await session.refresh(new_post)
+            await invalidate_post()
             return PostInDB.model_validate(new_post)
         except Exception as e:
             await session.rollback()
@@ -41,6 +172,7 @@ class PostManager:
             session.add(post)
             await session.commit()
             await session.refresh(post)
+            await invalidate_post(post_id)
             return PostInDB.model_validate(post)
         except NotFound as e:
             raise e
@@ -57,6 +189,7 @@ class PostManager:
 
             await session.delete(post)
             await session.commit()
+            await invalidate_post(post_id)
             return {"message": f"Post {post_id} was deleted successfully."}
         except NotFound as e:
             raise e
@@ -64,6 +197,38 @@ class PostManager:
             await session.rollback()
             raise InternalServerError(f"Internal Server Error: {e}")
 
+    @staticmethod
+    async def create_posts(session: AsyncSession, posts: List[PostCreate]):
+        try:
+            return await run_bulk(session, posts, insert_batch)
+        except BadRequest as e:
+            raise e
+        except Exception as e:
+            await session.rollback()
+            raise InternalServerError(f"Internal Server Error: {e}")
+
+    @staticmethod
+    async def update_posts(session: AsyncSession, updates: List[PostBulkUpdate]):
+        try:
+            return await run_bulk(session, updates, update_batch, lambda item: item.id)
+        except BadRequest as e:
+            raise e
+        except Exception as e:
+            await session.rollback()
+            raise InternalServerError(f"Internal Server Error: {e}")
+
+    @staticmethod
+    async def delete_posts(session: AsyncSession, post_ids: List[int]):
+        try:
+            return await run_bulk(
+                session, post_ids, delete_batch, lambda post_id: post_id, unique=True
+            )
+        except BadRequest as e:
+            raise e
+        except Exception as e:
+            await session.rollback()
+            raise InternalServerError(f"Internal Server Error: {e}")
+
     @staticmethod
     async def get_post(session: AsyncSession, post_id: int):
         try:
@@ -76,6 +241,38 @@ class PostManager:
         except Exception as e:
             raise InternalServerError(f"Internal Server Error: {e}")
 
+    @staticmethod
+    async def get_post_json(session: AsyncSession, post_id: int) -> bytes:
+        """Return the post serialized as JSON, from the cache when possible."""
+        # The key is taken before the query; see post_key().
+        key = await post_key(post_id)
+        body = await cache.get(key)
+        if body is None:
+            post = await PostManager.get_post(session, post_id)
+            body = post.model_dump_json().encode()
+            await cache.set(key, body)
+        return body
+
+    @staticmethod
+    async def get_posts_page_json(
+        session: AsyncSession,
+        skip: int,
+        limit: int,
+        after_id: Optional[int] = None,
+        include_total: bool = False,
+    ) -> bytes:
+        """Return one page of /posts/all serialized as JSON, from the cache when possible."""
+        key = await list_key(skip, limit, after_id, include_total)
+        body = await cache.get(key)
+        if body is None:
+            if after_id is not None:
+                page = await PostManager.get_posts_after(session, after_id, limit, include_total)
+            else:
+                page = await PostManager.get_all_posts_or_none(session, skip, limit)
+            body = json.dumps(jsonable_encoder(page)).encode()
+            await cache.set(key, body)
+        return body
+
     @staticmethod
     async def get_all_posts_or_none(session: AsyncSession, skip: int, limit: int):
         try:
@@ -108,15 +305,71 @@ class PostManager:
             raise InternalServerError(f"Internal Server Error: {e}")
 
     @staticmethod
-    async def search_posts(session: AsyncSession, search_term: str):
+    async def get_posts_after(
+        session: AsyncSession, after_id: int, limit: int, include_total: bool = False
+    ):
+        """
+        Keyset pagination: seek past after_id on the primary key instead of
+        skipping rows with OFFSET, so every page costs the same. The total is
+        only counted when asked for. limit must be at least 1; the router
+        rejects values outside 1 to 100.
+        """
         try:
-            search_query = select(Post).where(
-                or_(
-                    Post.title.ilike(f"%{search_term}%"),
-                    Post.content.ilike(f"%{search_term}%"),
-                    Post.category.ilike(f"%{search_term}%"),
-                )
+            posts_query = await session.execute(
+                select(Post).where(Post.id > after_id).order_by(Post.id).limit(limit + 1)
             )
+            posts = posts_query.scalars().all()
+
+            has_next = len(posts) > limit
+            posts = posts[:limit]
+            post_responses = [PostInDB.model_validate(post) for post in posts]
+
+            pagination = {
+                "limit": limit,
+                "after_id": after_id,
+                "has_previous": after_id > 0,
+                "has_next": has_next,
+                "next_cursor": encode_cursor(posts[-1].id) if has_next else None,
+            }
+            if include_total:
+                pagination["total"] = await session.scalar(func.count(Post.id))
+
+            return {"posts": post_responses, "pagination": pagination}
+
+        except Exception as e:
+            raise InternalServerError(f"Internal Server Error: {e}")
+
+    @staticmethod
+    async def search_posts(
+        session: AsyncSession, search_term: str, skip: int = 0, limit: int = 10
+    ):
+        try:
+            query = fts_query(search_term)
+            if session.bind.dialect.name == "sqlite" and query:
+                # Served by the posts_fts index and ranked by bm25 (best first).
+                search_query = select(Post).from_statement(
+                    text(
+                        "SELECT posts.* FROM posts_fts "
+                        "JOIN posts ON posts.id = posts_fts.rowid "
+                        "WHERE posts_fts MATCH :query "
+                        "ORDER BY bm25(posts_fts) "
+                        "LIMIT :limit OFFSET :skip"
+                    ).bindparams(query=query, limit=limit, skip=skip)
+                )
+            else:
+                search_query = (
+                    select(Post)
+                    .where(
+                        or_(
+                            Post.title.ilike(f"%{search_term}%"),
+                            Post.content.ilike(f"%{search_term}%"),
+                            Post.category.ilike(f"%{search_term}%"),
+                        )
+                    )
+                    .order_by(Post.id)
+                    .offset(skip)
+                    .limit(limit)
+                )
 
             result = await session.execute(search_query)
             posts = result.scalars().all()
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+# database.py and cache.py read their settings from the environment on import.
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///" + os.path.join(
+    tempfile.mkdtemp(), "test.db"
+)
+os.environ.pop("CACHE_URL", None)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from database import init_db  # noqa: E402
+from router import router  # noqa: E402
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db()
+    yield
+
+
+@pytest.fixture
+def client():
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(router)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def create_post(client):
+    def create_post(title="hello", content="hello world"):
+        response = client.post(
+            "/posts/",
+            json={"title": title, "content": content, "category": "test", "tags": []},
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    return create_post
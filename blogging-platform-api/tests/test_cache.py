@@ -0,0 +1,26 @@
+import asyncio
+
+from cache import LRUCache, cache, invalidate_post, post_key
+
+
+def test_body_stored_after_a_write_is_not_served():
+    async def scenario():
+        # A read takes the key, then a write lands before the read stores its body.
+        stale_key = await post_key(1)
+        await invalidate_post(1)
+        await cache.set(stale_key, b'{"title": "old"}')
+        return await cache.get(await post_key(1))
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_expired_versions_are_pruned():
+    lru = LRUCache(maxsize=4, ttl=1, version_ttl=0)
+
+    async def scenario():
+        for post_id in range(100):
+            await lru.bump(f"post:{post_id}:version")
+
+    asyncio.run(scenario())
+
+    assert len(lru._versions) <= 2 * lru.maxsize
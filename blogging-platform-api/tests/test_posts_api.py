@@ -0,0 +1,69 @@
+import pytest
+
+
+@pytest.mark.parametrize("query", ["limit=-1", "limit=0", "limit=101", "skip=-1"])
+def test_search_rejects_out_of_range_paging(client, query):
+    response = client.get(f"/posts/search?search_term=hello&{query}")
+
+    assert response.status_code == 422
+
+
+def test_search_returns_at_most_limit_posts(client, create_post):
+    create_post()
+    create_post()
+
+    response = client.get("/posts/search?search_term=hello&limit=1")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+
+def test_bulk_delete_reports_repeated_ids_as_duplicates(client, create_post):
+    post_id = create_post()["id"]
+
+    response = client.request(
+        "DELETE", "/posts/bulk", json={"ids": [post_id, post_id, 10**9]}
+    )
+
+    body = response.json()
+    assert body["succeeded"] == 1
+    assert [(result["id"], result["error"]) for result in body["results"]] == [
+        (post_id, None),
+        (post_id, "Duplicate id"),
+        (10**9, "Post not found"),
+    ]
+
+
+def test_bulk_update_retry_reports_the_failing_item_id(client, create_post):
+    good, bad = create_post()["id"], create_post()["id"]
+
+    # title=None violates NOT NULL, failing the batch and then this item alone.
+    response = client.patch(
+        "/posts/bulk",
+        json=[{"id": good, "content": "updated"}, {"id": bad, "title": None, "content": "x"}],
+    )
+
+    results = response.json()["results"]
+    assert results[0] == {"index": 0, "id": good, "ok": True, "error": None}
+    assert results[1]["id"] == bad
+    assert not results[1]["ok"]
+
+
+@pytest.mark.parametrize(
+    "query", ["limit=0", "limit=-3", "limit=101", "after_id=-1", "after_id=0&limit=0"]
+)
+def test_list_rejects_out_of_range_paging(client, query):
+    response = client.get(f"/posts/all?{query}")
+
+    assert response.status_code == 422
+
+
+def test_cursor_pages_follow_each_other(client, create_post):
+    first, second = create_post()["id"], create_post()["id"]
+
+    page = client.get(f"/posts/all?after_id={first - 1}&limit=1").json()
+    assert [post["id"] for post in page["posts"]] == [first]
+
+    cursor = page["pagination"]["next_cursor"]
+    page = client.get(f"/posts/all?cursor={cursor}&limit=1").json()
+    assert [post["id"] for post in page["posts"]] == [second]